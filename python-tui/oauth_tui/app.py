@@ -1,42 +1,88 @@
 """Main OAuth TUI application."""
 
 import atexit
+import importlib
+import io
+import os
 import signal
 import sys
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar
+
+try:
+    import termios
+except ImportError:  # Windows has no termios
+    termios = None  # type: ignore[assignment]
 
 from textual.app import App
 from textual.binding import Binding
+from textual.screen import Screen
+
+if TYPE_CHECKING:
+    from .services.oauth_client import OAuthClient
+
+# Disable any-event, button-event and basic mouse reporting
+_RESET_BYTES = b"\033[?1003l\033[?1002l\033[?1000l"
 
-from .screens.auth import AuthScreen
-from .screens.config import ConfigScreen
-from .screens.dashboard import DashboardScreen
-from .screens.help import HelpScreen
-from .screens.inspector import InspectorScreen
-from .screens.menu import MenuScreen
-from .screens.tokens import TokensScreen
-from .services.oauth_client import OAuthClient
+_saved_termios: list[Any] | None = None
+
+
+def _save_terminal_state() -> None:
+    """Snapshot the terminal attributes before Textual switches to raw mode."""
+    global _saved_termios
+    if termios is None or _saved_termios is not None:
+        return
+    try:
+        _saved_termios = termios.tcgetattr(sys.stdin.fileno())
+    except (termios.error, io.UnsupportedOperation, ValueError):
+        pass
 
 
 def _cleanup_terminal() -> None:
     """Clean up terminal state to prevent control sequence issues."""
     try:
-        sys.stdout.write("\033[?1003l\033[?1002l\033[?1000l")
-        sys.stdout.flush()
+        # Mouse reporting is emulator state that termios can't reset, so the
+        # escape sequences are still needed alongside the termios restore. They
+        # go straight to fd 1 so shutdown doesn't depend on stdio buffering.
+        os.write(1, _RESET_BYTES)
+        if _saved_termios is not None:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, _saved_termios)
     except Exception:
         pass
 
 
-atexit.register(_cleanup_terminal)
-
-
 def _signal_handler(signum: int, frame) -> None:
     """Handle signals with terminal cleanup."""
     _cleanup_terminal()
     sys.exit(0)
 
 
-signal.signal(signal.SIGINT, _signal_handler)
-signal.signal(signal.SIGTERM, _signal_handler)
+def _install_shutdown_handlers() -> None:
+    """Register the cleanup handlers once per process, however many apps are created."""
+    if signal.getsignal(signal.SIGINT) is _signal_handler:
+        return
+    atexit.register(_cleanup_terminal)
+    signal.signal(signal.SIGINT, _signal_handler)
+    signal.signal(signal.SIGTERM, _signal_handler)
+
+
+# Screen name -> class name; each screen lives in oauth_tui.screens.<name>
+_SCREENS = (
+    ("menu", "MenuScreen"),
+    ("tokens", "TokensScreen"),
+    ("dashboard", "DashboardScreen"),
+    ("auth", "AuthScreen"),
+    ("config", "ConfigScreen"),
+    ("inspector", "InspectorScreen"),
+    ("help", "HelpScreen"),
+)
+
+
+def _create_screen(name: str, class_name: str) -> Screen:
+    """Import a screen module on demand and instantiate its screen."""
+    module = importlib.import_module(f".screens.{name}", __package__)
+    return getattr(module, class_name)()
 
 
 class OAuthTUI(App):
@@ -50,7 +96,11 @@ class OAuthTUI(App):
         Binding("ctrl+c", "quit", "Quit", priority=True, show=False),
     ]
 
-    oauth_client: OAuthClient
+    # Screens are registered as factories, so each module is imported and its
+    # screen constructed on first push; startup only builds the initial one.
+    SCREENS: ClassVar[dict[str, Callable[[], Screen[Any]]]] = {
+        name: partial(_create_screen, name, class_name) for name, class_name in _SCREENS
+    }
 
     def __init__(self, initial_view: str = "menu"):
         """Initialize OAuth TUI.
@@ -60,32 +110,49 @@ class OAuthTUI(App):
         """
         super().__init__()
         self.initial_view = initial_view
-        self.oauth_client = OAuthClient()
+        self._oauth_client: OAuthClient | None = None
+        _save_terminal_state()
+        self._setup_signal_handlers()
+
+    @property
+    def oauth_client(self) -> "OAuthClient":
+        """OAuth client, created on first use so it doesn't delay the first frame."""
+        if self._oauth_client is None:
+            # Imported here so the services stay unloaded until a screen needs them
+            from .services.oauth_client import OAuthClient
+
+            self._oauth_client = OAuthClient()
+        return self._oauth_client
+
+    @oauth_client.setter
+    def oauth_client(self, client: "OAuthClient") -> None:
+        self._oauth_client = client
+
+    def _setup_signal_handlers(self) -> None:
+        """Set up signal handlers for terminal cleanup."""
+        _install_shutdown_handlers()
+
+    def _cleanup_terminal(self) -> None:
+        """Restore the terminal state."""
+        _cleanup_terminal()
 
     def on_mount(self) -> None:
         """Handle mount event."""
-        # Install screens
-        self.install_screen(MenuScreen(), name="menu")
-        self.install_screen(TokensScreen(), name="tokens")
-        self.install_screen(DashboardScreen(), name="dashboard")
-        self.install_screen(AuthScreen(), name="auth")
-        self.install_screen(ConfigScreen(), name="config")
-        self.install_screen(InspectorScreen(), name="inspector")
-        self.install_screen(HelpScreen(), name="help")
-
-        # Push initial screen
-        if self.initial_view == "tokens":
-            self.push_screen("tokens")
-        else:
-            self.push_screen("menu")
-
-    def on_unmount(self) -> None:
-        """Handle unmount event with terminal cleanup."""
-        _cleanup_terminal()
+        initial = "tokens" if self.initial_view == "tokens" else "menu"
 
-    def on_exit(self) -> None:
-        """Handle app exit and ensure terminal is properly restored."""
-        _cleanup_terminal()
+        # Textual turns on any-event mouse tracking (1003), which reports every
+        # cursor movement and keeps the event loop busy while idle. None of the
+        # screens use hover, so fall back to button-event tracking (1002).
+        if self._driver is not None and not self.is_headless:
+            self._driver.write("\033[?1003l\033[?1002h")
+
+        self.push_screen(initial)
+
+    async def on_unmount(self) -> None:
+        """Handle unmount event with terminal cleanup."""
+        if self._oauth_client is not None:
+            await self._oauth_client.close()
+        self._cleanup_terminal()
 
 
 def main() -> None:
@@ -102,13 +169,8 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    app = OAuthTUI(initial_view=args.view)
-    try:
-        app.run()
-    finally:
-        # Ensure terminal is always cleaned up
-        sys.stdout.write("\033[?1003l\033[?1002l\033[?1000l")
-        sys.stdout.flush()
+    # Terminal restoration is handled by on_unmount and the atexit hook
+    OAuthTUI(initial_view=args.view).run()
 
 
 if __name__ == "__main__":
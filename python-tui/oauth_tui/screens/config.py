@@ -1,5 +1,6 @@
 """Configuration screen for OAuth TUI."""
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
 from textual import on, work
@@ -8,7 +9,8 @@ from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.reactive import reactive
 from textual.screen import ModalScreen, Screen
-from textual.validation import Length, ValidationResult, Validator
+from textual.timer import Timer
+from textual.validation import Validator
 from textual.widgets import (
     Button,
     DataTable,
@@ -21,22 +23,96 @@ from textual.widgets import (
     Static,
 )
 
+from ..utils.validators import REQUIRED, URL
+from ..widgets.table_rows import TableRows
+from .tokens import ConfirmationScreen
+
 if TYPE_CHECKING:
     from ..app import OAuthTUI
 
+PROVIDER_TYPE_OPTIONS = (
+    ("Generic OAuth 2.0", "generic"),
+    ("Google", "google"),
+    ("Microsoft", "microsoft"),
+    ("GitHub", "github"),
+    ("Auth0", "auth0"),
+    ("Okta", "okta"),
+)
 
-class URLValidator(Validator):
-    """Validator for URL fields."""
-
-    def validate(self, value: str) -> ValidationResult:
-        """Validate that the value is a proper URL."""
-        if not value:
-            return self.failure("URL cannot be empty")
-
-        if not (value.startswith("http://") or value.startswith("https://")):
-            return self.failure("URL must start with http:// or https://")
+# Default (authorization URL, token URL) for provider types with fixed endpoints
+PROVIDER_DEFAULTS: dict[str, tuple[str, str]] = {
+    "google": (
+        "https://accounts.google.com/o/oauth2/v2/auth",
+        "https://oauth2.googleapis.com/token",
+    ),
+    "microsoft": (
+        "https://login.microsoftonline.com/common/oauth2/v2.0/authorize",
+        "https://login.microsoftonline.com/common/oauth2/v2.0/token",
+    ),
+    "github": (
+        "https://github.com/login/oauth/authorize",
+        "https://github.com/login/oauth/access_token",
+    ),
+}
+
+# URLs longer than this are cut short with an ellipsis in the providers table
+_URL_MAX = 40
+_ELLIPSIS = "..."
+
+
+def _truncate_url(url: str) -> str:
+    """Shorten a URL to fit the providers table."""
+    if len(url) <= _URL_MAX:
+        return url
+    return url[: _URL_MAX - len(_ELLIPSIS)] + _ELLIPSIS
+
+
+@lru_cache(maxsize=64)
+def _type_title(provider_type: str) -> str:
+    """Title-case a provider type; there are only a handful of distinct types."""
+    return provider_type.title()
+
+
+def _provider_row(provider: dict[str, Any]) -> tuple[str, ...]:
+    """Build the table cells for a provider."""
+    name = provider.get("name", "Unknown")
+    provider_type = _type_title(provider.get("type", "generic"))
+
+    # Determine status (simplified - could check if credentials are set)
+    status = "Configured" if provider.get("client_id") else "Incomplete"
+
+    auth_url = provider.get("auth_url", "N/A")
+    token_url = provider.get("token_url", "N/A")
+
+    return (name, provider_type, status, _truncate_url(auth_url), _truncate_url(token_url))
+
+
+_STATUS_MESSAGES = {0: "No providers configured", 1: "1 provider configured"}
+
+# Provider form inputs: (input id, data key, label, placeholder, password, validator)
+_PROVIDER_FIELDS: tuple[tuple[str, str, str, str, bool, Validator | None], ...] = (
+    ("provider_name", "name", "Provider Name:", "e.g., my-oauth-provider", False, REQUIRED),
+    (
+        "auth_url",
+        "auth_url",
+        "Authorization URL:",
+        "https://example.com/oauth/authorize",
+        False,
+        URL,
+    ),
+    ("token_url", "token_url", "Token URL:", "https://example.com/oauth/token", False, URL),
+    ("client_id", "client_id", "Client ID:", "Your OAuth client ID", False, REQUIRED),
+    ("client_secret", "client_secret", "Client Secret:", "Your OAuth client secret", True, None),
+    ("scopes", "scopes", "Default Scopes:", "read write admin (space-separated)", False, None),
+)
 
-        return self.success()
+# Required provider fields, checked in order: (form data key, error message)
+_REQUIRED_FIELDS = (
+    ("name", "Provider name is required"),
+    ("auth_url", "Authorization URL is required"),
+    ("token_url", "Token URL is required"),
+    ("client_id", "Client ID is required"),
+)
 
 
 class ProviderEditModal(ModalScreen):
@@ -47,6 +123,7 @@ class ProviderEditModal(ModalScreen):
         self.provider_data = provider_data or {}
         self.is_edit = is_edit
         self._modal_title = "Edit Provider" if is_edit else "Add Provider"
+        self._inputs: dict[str, Input] = {}
 
     BINDINGS = [
         Binding("escape", "cancel", "Cancel"),
@@ -102,82 +179,43 @@ class ProviderEditModal(ModalScreen):
     }
     """
 
+    # Provider type selector, cached in compose
+    _provider_type: Select
+
     def compose(self) -> ComposeResult:
         with Container(id="modal-container"):
             yield Static(self._modal_title, id="modal-title")
 
-            # Provider form fields
-            yield Label("Provider Name:", classes="form-label")
-            provider_input = Input(
-                placeholder="e.g., my-oauth-provider",
-                id="provider_name",
-                validators=[Length(minimum=1)],
-            )
-            if self.provider_data.get("name"):
-                provider_input.value = self.provider_data["name"]
-            yield provider_input
+            # Provider form fields, with the type selector after the name
+            yield from self.compose_fields(_PROVIDER_FIELDS[:1])
 
             yield Label("Provider Type:", classes="form-label")
-            type_select = Select(
-                [
-                    ("Generic OAuth 2.0", "generic"),
-                    ("Google", "google"),
-                    ("Microsoft", "microsoft"),
-                    ("GitHub", "github"),
-                    ("Auth0", "auth0"),
-                    ("Okta", "okta"),
-                ],
-                id="provider_type",
-            )
-            yield type_select
-
-            yield Label("Authorization URL:", classes="form-label")
-            auth_url_input = Input(
-                placeholder="https://example.com/oauth/authorize",
-                id="auth_url",
-                validators=[URLValidator()],
-            )
-            if self.provider_data.get("auth_url"):
-                auth_url_input.value = self.provider_data["auth_url"]
-            yield auth_url_input
-
-            yield Label("Token URL:", classes="form-label")
-            token_url_input = Input(
-                placeholder="https://example.com/oauth/token",
-                id="token_url",
-                validators=[URLValidator()],
-            )
-            if self.provider_data.get("token_url"):
-                token_url_input.value = self.provider_data["token_url"]
-            yield token_url_input
-
-            yield Label("Client ID:", classes="form-label")
-            client_id_input = Input(
-                placeholder="Your OAuth client ID", id="client_id", validators=[Length(minimum=1)]
-            )
-            if self.provider_data.get("client_id"):
-                client_id_input.value = self.provider_data["client_id"]
-            yield client_id_input
+            self._provider_type = Select(PROVIDER_TYPE_OPTIONS, id="provider_type")
+            yield self._provider_type
 
-            yield Label("Client Secret:", classes="form-label")
-            client_secret_input = Input(
-                placeholder="Your OAuth client secret", password=True, id="client_secret"
-            )
-            if self.provider_data.get("client_secret"):
-                client_secret_input.value = self.provider_data["client_secret"]
-            yield client_secret_input
-
-            yield Label("Default Scopes:", classes="form-label")
-            scopes_input = Input(placeholder="read write admin (space-separated)", id="scopes")
-            if self.provider_data.get("scopes"):
-                scopes_input.value = self.provider_data["scopes"]
-            yield scopes_input
+            yield from self.compose_fields(_PROVIDER_FIELDS[1:])
 
             # Button bar
             with Horizontal(id="button-bar"):
                 yield Button("Save", id="save", variant="primary")
                 yield Button("Cancel", id="cancel")
 
+    def compose_fields(
+        self, fields: tuple[tuple[str, str, str, str, bool, Validator | None], ...]
+    ) -> ComposeResult:
+        """Yield labelled inputs for form fields, filled from the provider data."""
+        for input_id, key, label, placeholder, password, validator in fields:
+            yield Label(label, classes="form-label")
+            field = Input(
+                value=self.provider_data.get(key) or "",
+                placeholder=placeholder,
+                password=password,
+                id=input_id,
+                validators=[validator] if validator else None,
+            )
+            self._inputs[key] = field
+            yield field
+
     @on(Button.Pressed, "#save")
     def on_save_pressed(self) -> None:
         """Handle save button press."""
@@ -191,61 +229,30 @@ class ProviderEditModal(ModalScreen):
     @on(Select.Changed, "#provider_type")
     def on_provider_type_changed(self, event: Select.Changed) -> None:
         """Handle provider type selection to populate default URLs."""
-        provider_type = event.value
-
-        # Set default URLs based on provider type
-        auth_url_input = self.query_one("#auth_url", Input)
-        token_url_input = self.query_one("#token_url", Input)
-
-        if provider_type == "google":
-            auth_url_input.value = "https://accounts.google.com/o/oauth2/v2/auth"
-            token_url_input.value = "https://oauth2.googleapis.com/token"
-        elif provider_type == "microsoft":
-            auth_url_input.value = "https://login.microsoftonline.com/common/oauth2/v2.0/authorize"
-            token_url_input.value = "https://login.microsoftonline.com/common/oauth2/v2.0/token"
-        elif provider_type == "github":
-            auth_url_input.value = "https://github.com/login/oauth/authorize"
-            token_url_input.value = "https://github.com/login/oauth/access_token"
-
-    def get_form_data(self) -> dict[str, str] | None:
+        defaults = PROVIDER_DEFAULTS.get(str(event.value))
+        if defaults:
+            auth_url, token_url = defaults
+            self._inputs["auth_url"].value = auth_url
+            self._inputs["token_url"].value = token_url
+
+    def get_form_data(self) -> dict[str, str]:
         """Get form data."""
-        try:
-            return {
-                "name": self.query_one("#provider_name", Input).value.strip(),
-                "type": str(self.query_one("#provider_type", Select).value or ""),
-                "auth_url": self.query_one("#auth_url", Input).value.strip(),
-                "token_url": self.query_one("#token_url", Input).value.strip(),
-                "client_id": self.query_one("#client_id", Input).value.strip(),
-                "client_secret": self.query_one("#client_secret", Input).value.strip(),
-                "scopes": self.query_one("#scopes", Input).value.strip(),
-            }
-        except Exception:
-            return None
+        data = {key: field.value.strip() for key, field in self._inputs.items()}
+        data["type"] = str(self._provider_type.value or "")
+        return data
 
     def validate_form_data(self, data: dict[str, str]) -> bool:
         """Validate the form data."""
-        if not data.get("name"):
-            self.notify("Provider name is required", severity="error")
-            return False
-
-        if not data.get("auth_url"):
-            self.notify("Authorization URL is required", severity="error")
-            return False
-
-        if not data.get("token_url"):
-            self.notify("Token URL is required", severity="error")
-            return False
-
-        if not data.get("client_id"):
-            self.notify("Client ID is required", severity="error")
-            return False
-
+        for field, message in _REQUIRED_FIELDS:
+            if not data.get(field):
+                self.notify(message, severity="error")
+                return False
         return True
 
     def action_save(self) -> None:
         """Save the provider configuration."""
         data = self.get_form_data()
-        if data and self.validate_form_data(data):
+        if self.validate_form_data(data):
             self.dismiss(data)
 
     def action_cancel(self) -> None:
@@ -319,9 +326,17 @@ class ConfigScreen(Screen):
 
     # Reactive attributes for state management
     loading: reactive[bool] = reactive(False)
-    providers: reactive[list[dict[str, Any]]] = reactive([])
+    providers: reactive[list[dict[str, Any]]] = reactive(list)
     selected_provider_index: reactive[int | None] = reactive(None)
 
+    _table: DataTable
+    # Table rows as last rendered, parallel to self.providers
+    _rows: TableRows
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._render_timer: Timer | None = None
+
     def compose(self) -> ComposeResult:
         """Compose the config screen layout."""
         yield Header(show_clock=True)
@@ -340,6 +355,12 @@ class ConfigScreen(Screen):
             table: DataTable = DataTable(id="providers-table")
             table.cursor_type = "row"
             table.zebra_stripes = True
+            self._table = table
+            self._rows = TableRows(
+                table,
+                table.add_columns("Name", "Type", "Status", "Auth URL", "Token URL"),
+                placeholder=("No providers configured", "-", "-", "-", "-"),
+            )
             yield table
 
             # Button bar
@@ -367,46 +388,57 @@ class ConfigScreen(Screen):
             status_text.update("Loading providers...")
         else:
             provider_count = len(self.providers)
-            if provider_count == 0:
-                status_text.update("No providers configured")
-            else:
-                status_text.update(
-                    f"{provider_count} provider{'s' if provider_count != 1 else ''} configured"
-                )
+            status_text.update(
+                _STATUS_MESSAGES.get(provider_count) or f"{provider_count} providers configured"
+            )
 
     def watch_providers(self, providers: list[dict[str, Any]]) -> None:
         """React to providers list changes."""
+        # Coalesce bursts of assignments into a single table update per frame
+        if self._render_timer is None:
+            self._render_timer = self.set_timer(1 / 60, self._flush_render)
+
+    def _flush_render(self) -> None:
+        self._render_timer = None
         self.update_table()
 
     def update_table(self) -> None:
-        """Update the providers table display."""
-        table = self.query_one("#providers-table", DataTable)
-        table.clear(columns=True)
-
-        # Add columns
-        table.add_columns("Name", "Type", "Status", "Auth URL", "Token URL")
-
-        if not self.providers:
-            table.add_row("No providers configured", "-", "-", "-", "-")
-            return
-
-        for provider in self.providers:
-            name = provider.get("name", "Unknown")
-            provider_type = provider.get("type", "generic").title()
-
-            # Determine status (simplified - could check if credentials are set)
-            status = "Configured" if provider.get("client_id") else "Incomplete"
-
-            auth_url = provider.get("auth_url", "N/A")
-            token_url = provider.get("token_url", "N/A")
-
-            # Truncate URLs for display
-            if len(auth_url) > 40:
-                auth_url = auth_url[:37] + "..."
-            if len(token_url) > 40:
-                token_url = token_url[:37] + "..."
-
-            table.add_row(name, provider_type, status, auth_url, token_url)
+        """Update the providers table, touching only the rows that changed."""
+        self._rows.sync([_provider_row(provider) for provider in self.providers])
+
+    def _render_row(self, index: int | None, provider: dict[str, Any] | None) -> None:
+        """Apply a single provider change to the table.
+
+        Args:
+            index: Row to change, or None to append a row
+            provider: New provider data, or None to remove the row
+        """
+        if index is None:
+            if provider is not None:
+                self._rows.append(_provider_row(provider))
+        elif provider is None:
+            self._rows.remove(index)
+        else:
+            self._rows.update(index, _provider_row(provider))
+        self._rows.sync_placeholder()
+
+    def _apply_provider_change(self, index: int | None, new: dict[str, Any] | None) -> None:
+        """Change self.providers in place and update only the affected row.
+
+        Args:
+            index: Provider to change, or None to append ``new``
+            new: New provider data, or None to delete the provider at ``index``
+        """
+        if index is None:
+            if new is not None:
+                self.providers.append(new)
+        elif new is None:
+            del self.providers[index]
+        else:
+            self.providers[index] = new
+        # A pending flush re-renders from self.providers anyway
+        if self._render_timer is None:
+            self._render_row(index, new)
 
     @work(exclusive=True)
     async def load_providers(self) -> None:
@@ -415,7 +447,9 @@ class ConfigScreen(Screen):
         try:
             oauth_client = cast("OAuthTUI", self.app).oauth_client
             providers = await oauth_client.get_providers()
-            self.providers = providers
+            # Refreshing with unchanged data shouldn't touch the table
+            if providers != self.providers:
+                self.providers = providers
             self.notify(f"Loaded {len(providers)} providers", severity="information")
         except Exception as e:
             self.notify(f"Error loading providers: {str(e)}", severity="error")
@@ -469,7 +503,7 @@ class ConfigScreen(Screen):
             if result:
                 # In a real implementation, this would save to configuration
                 # For now, we'll add to our local list and show success
-                self.providers = self.providers + [result]
+                self._apply_provider_change(None, result)
                 self.notify(
                     f"Provider '{result['name']}' added successfully",
                     severity="information",
@@ -488,9 +522,7 @@ class ConfigScreen(Screen):
             if result:
                 # Update the provider in our list
                 if self.selected_provider_index is not None:
-                    providers_copy = list(self.providers)
-                    providers_copy[self.selected_provider_index] = result
-                    self.providers = providers_copy
+                    self._apply_provider_change(self.selected_provider_index, result)
                     self.notify(
                         f"Provider '{result['name']}' updated successfully", severity="information"
                     )
@@ -509,17 +541,12 @@ class ConfigScreen(Screen):
         def confirm_delete(result: bool | None) -> None:
             if result and self.selected_provider_index is not None:
                 # Remove from our list
-                providers_copy = list(self.providers)
-                del providers_copy[self.selected_provider_index]
-                self.providers = providers_copy
+                self._apply_provider_change(self.selected_provider_index, None)
                 self.notify(
                     f"Provider '{provider_name}' deleted successfully",
                     severity="information",
                 )
 
-        # Import the confirmation screen from tokens.py
-        from .tokens import ConfirmationScreen
-
         self.app.push_screen(
             ConfirmationScreen(
                 f"Delete provider '{provider_name}'?",
@@ -1,17 +1,24 @@
 """Dashboard screen for OAuth TUI."""
 
+import asyncio
+import heapq
+import importlib
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cache
 from typing import TYPE_CHECKING, Any, cast
 
+from rich.table import Table
+from rich.text import Text
 from textual import on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.reactive import reactive
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
-    DataTable,
     Footer,
     Header,
     LoadingIndicator,
@@ -20,26 +27,70 @@ from textual.widgets import (
     TabPane,
 )
 
+from ..utils.timestamps import current_times, to_datetime
+
 if TYPE_CHECKING:
     from ..app import OAuthTUI
 
 
+# Minimum time between dashboard reloads, in seconds
+_REFRESH_INTERVAL = 0.25
+
+# Tokens expiring within this window are shown as "Expiring Soon"
+_ONE_HOUR = timedelta(hours=1)
+
+
+# Provider, type, status, expires and issued columns of the recent-tokens table
+RowTuple = tuple[str, str, str, str, str]
+
+_RECENT_COLUMNS = ("Provider", "Type", "Status", "Expires", "Issued")
+_NO_TOKENS_ROW: RowTuple = ("No tokens found", "-", "-", "-", "-")
+
+
+@dataclass(slots=True, frozen=True)
+class DashSnapshot:
+    """Dashboard values captured in one pass, before any widget is updated."""
+
+    total_tokens: int
+    total_providers: int
+    expired: int
+    status: str
+    recent: list[RowTuple]
+
+
+@cache
+def _screen_class(module: str, class_name: str) -> type[Screen]:
+    """Look up a sibling screen class, importing its module on first use.
+
+    The import is deferred because the other screens import this package too.
+    """
+    return getattr(importlib.import_module(f".{module}", __package__), class_name)
+
+
 class StatCard(Container):
     """A card widget for displaying statistics."""
 
-    def __init__(self, title: str, value: str, subtitle: str = "", color: str = "primary"):
-        super().__init__()
-        self.title = title
-        self.value = value
-        self.subtitle = subtitle
+    def __init__(
+        self,
+        title: str,
+        value: str,
+        subtitle: str = "",
+        color: str = "primary",
+        id: str | None = None,  # noqa: A002 - matches the Textual widget API
+    ):
+        super().__init__(id=id)
         self.color = color
+        # The card's text lives only in these widgets, which set_value updates
+        self._title_static = Static(title, classes="stat-title")
+        self._value_static = Static(value, classes="stat-value")
+        self._subtitle_static = Static(subtitle, classes="stat-subtitle") if subtitle else None
 
-    CSS = """
+    DEFAULT_CSS = """
     StatCard {
         width: 1fr;
         height: 6;
         border: solid $primary;
-        padding: 1;
+        padding: 0 1;
         margin: 0 1 1 0;
         background: $surface-lighten-1;
     }
@@ -54,7 +105,7 @@ class StatCard(Container):
         text-style: bold;
         text-align: center;
         color: $accent;
-        margin: 1 0;
+        margin: 1 0 0 0;
     }
 
     .stat-subtitle {
@@ -64,10 +115,16 @@ class StatCard(Container):
     """
 
     def compose(self) -> ComposeResult:
-        yield Static(self.title, classes="stat-title")
-        yield Static(self.value, classes="stat-value")
-        if self.subtitle:
-            yield Static(self.subtitle, classes="stat-subtitle")
+        yield self._title_static
+        yield self._value_static
+        if self._subtitle_static is not None:
+            yield self._subtitle_static
+
+    def set_value(self, value: str, subtitle: str | None = None) -> None:
+        """Update the displayed value, and the subtitle if one is given."""
+        self._value_static.update(value)
+        if subtitle is not None and self._subtitle_static is not None:
+            self._subtitle_static.update(subtitle)
 
 
 class DashboardScreen(Screen):
@@ -132,7 +189,7 @@ class DashboardScreen(Screen):
         padding: 1;
     }
 
-    DataTable {
+    #recent-tokens-static {
         height: 1fr;
         margin-bottom: 1;
     }
@@ -179,10 +236,18 @@ class DashboardScreen(Screen):
 
     # Reactive attributes for state management
     loading: reactive[bool] = reactive(False)
-    stats: reactive[dict[str, Any]] = reactive({})
     tokens: reactive[list[dict[str, Any]]] = reactive([])
     providers: reactive[list[dict[str, Any]]] = reactive([])
 
+    # Refresh throttling: at most one load per _REFRESH_INTERVAL
+    _refresh_timer: Timer | None = None
+    _refresh_pending = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        # POSIX expiry times of the current tokens that have a valid expires_at
+        self._expiry_times: list[float] = []
+
     def compose(self) -> ComposeResult:
         """Compose the dashboard screen layout."""
         yield Header(show_clock=True)
@@ -199,10 +264,10 @@ class DashboardScreen(Screen):
 
             # Statistics cards
             with Container(id="stats-grid"), Horizontal(id="stats-row"):
-                yield StatCard("Total Tokens", "0", "Active tokens")
-                yield StatCard("Providers", "0", "Configured")
-                yield StatCard("Expired", "0", "Need refresh")
-                yield StatCard("Status", "Ready", "System status")
+                yield StatCard("Total Tokens", "0", "Active tokens", id="stat-total")
+                yield StatCard("Providers", "0", "Configured", id="stat-providers")
+                yield StatCard("Expired", "0", "Need refresh", id="stat-expired")
+                yield StatCard("Status", "Ready", "System status", id="stat-status")
 
             # Main content with tabs
             with Container(id="main-content"), TabbedContent():
@@ -245,12 +310,9 @@ class DashboardScreen(Screen):
 
     def create_recent_tokens_panel(self) -> Container:
         """Create the recent tokens panel."""
-        table: DataTable = DataTable(id="recent-tokens-table")
-        table.cursor_type = "row"
-        table.zebra_stripes = True
-
+        # Read-only, so a rich table in a Static instead of an interactive DataTable
         return Container(
-            table,
+            Static(id="recent-tokens-static"),
             classes="content-container",
         )
 
@@ -258,22 +320,31 @@ class DashboardScreen(Screen):
         """Create the system information panel."""
         return Container(
             Static("System Information", classes="info-text"),
-            Static("OAuth Client Status:", classes="warning-text"),
-            Static("✅ CLI Bridge: Connected", classes="success-text"),
-            Static("✅ Node.js Backend: Available", classes="success-text"),
-            Static("✅ Configuration: Loaded", classes="success-text"),
-            Static("\nCapabilities:", classes="warning-text"),
-            Static("• Client Credentials Flow", classes="info-text"),
-            Static("• Authorization Code Flow (Planned)", classes="info-text"),
-            Static("• Device Flow (Planned)", classes="info-text"),
-            Static("• JWT Token Inspection", classes="info-text"),
-            Static("• Provider Management", classes="info-text"),
-            Static("\nKeyboard Shortcuts:", classes="warning-text"),
-            Static("• R: Refresh data", classes="info-text"),
-            Static("• T: View tokens", classes="info-text"),
-            Static("• A: Authenticate", classes="info-text"),
-            Static("• C: Configure providers", classes="info-text"),
-            Static("• Escape: Back to menu", classes="info-text"),
+            Static(
+                "[$warning bold]OAuth Client Status:[/]\n"
+                "✅ CLI Bridge: Connected\n"
+                "✅ Node.js Backend: Available\n"
+                "✅ Configuration: Loaded",
+                classes="success-text",
+            ),
+            Static(
+                "\n[$warning bold]Capabilities:[/]\n"
+                "• Client Credentials Flow\n"
+                "• Authorization Code Flow (Planned)\n"
+                "• Device Flow (Planned)\n"
+                "• JWT Token Inspection\n"
+                "• Provider Management",
+                classes="info-text",
+            ),
+            Static(
+                "\n[$warning bold]Keyboard Shortcuts:[/]\n"
+                "• R: Refresh data\n"
+                "• T: View tokens\n"
+                "• A: Authenticate\n"
+                "• C: Configure providers\n"
+                "• Escape: Back to menu",
+                classes="info-text",
+            ),
             classes="content-container",
         )
 
@@ -294,101 +365,105 @@ class DashboardScreen(Screen):
             last_update = datetime.now().strftime("%H:%M:%S")
             status_text.update(f"Last updated: {last_update}")
 
-    def watch_stats(self, stats: dict[str, Any]) -> None:
-        """React to stats changes."""
-        self.update_stat_cards()
-
     def watch_tokens(self, tokens: list[dict[str, Any]]) -> None:
         """React to tokens changes."""
-        self.update_recent_tokens_table()
+        self._expiry_times = self._collect_expiry_times(tokens)
+
+    def take_snapshot(
+        self, now: datetime | None = None, now_utc: datetime | None = None
+    ) -> DashSnapshot:
+        """Capture everything the dashboard widgets show from the current state.
+
+        Args:
+            now: Naive local time to render against, the current time if omitted
+            now_utc: Aware UTC time to render against, the current time if omitted
+        """
+        if now is None or now_utc is None:
+            now, now_utc = current_times()
+        # Expiry depends on the clock, so recount on every load: a reload that
+        # returns the same tokens doesn't run watch_tokens
+        expired = self.count_expired_tokens(now_utc.timestamp())
+        return DashSnapshot(
+            total_tokens=len(self.tokens),
+            total_providers=len(self.providers),
+            expired=expired,
+            status=self.get_system_status(expired),
+            recent=self.build_recent_rows(now, now_utc),
+        )
+
+    def build_recent_rows(self, now: datetime, now_utc: datetime) -> list[RowTuple]:
+        """Format the rows of the recent tokens table.
 
-    def update_stat_cards(self) -> None:
+        Args:
+            now: Current naive local time, compared with naive timestamps
+            now_utc: Current aware UTC time, compared with aware timestamps
+        """
+        try:
+            # Most recently issued first, top 10 only
+            recent_tokens = heapq.nlargest(10, self.tokens, key=lambda t: t.get("issued_at", 0))
+            return [
+                (
+                    token.get("provider", "Unknown"),
+                    token.get("token_type", "Bearer"),
+                    self.get_token_status(token, now, now_utc),
+                    self.format_expiration(token, now, now_utc),
+                    self.format_issued_time(token, now, now_utc),
+                )
+                for token in recent_tokens
+            ]
+        except Exception as e:
+            self.notify(f"Error updating tokens table: {str(e)}", severity="error")
+            return []
+
+    def update_stat_cards(self, snapshot: DashSnapshot) -> None:
         """Update the statistics cards."""
         try:
-            # Calculate statistics
-            total_tokens = len(self.tokens)
-            total_providers = len(self.providers)
-            expired_tokens = self.count_expired_tokens()
-            system_status = self.get_system_status()
-
-            # Update the cards by removing and re-adding them
-            stats_row = self.query_one("#stats-row", Horizontal)
-            stats_row.remove_children()
-
-            # Add updated cards
-            stats_row.mount(
-                StatCard("Total Tokens", str(total_tokens), "Active tokens"),
-                StatCard("Providers", str(total_providers), "Configured"),
-                StatCard("Expired", str(expired_tokens), "Need refresh"),
-                StatCard("Status", system_status, "System status"),
-            )
+            self.query_one("#stat-total", StatCard).set_value(str(snapshot.total_tokens))
+            self.query_one("#stat-providers", StatCard).set_value(str(snapshot.total_providers))
+            self.query_one("#stat-expired", StatCard).set_value(str(snapshot.expired))
+            self.query_one("#stat-status", StatCard).set_value(snapshot.status)
         except Exception as e:
             self.notify(f"Error updating stats: {str(e)}", severity="error")
 
-    def update_recent_tokens_table(self) -> None:
+    def update_recent_tokens_table(self, snapshot: DashSnapshot) -> None:
         """Update the recent tokens table."""
         try:
-            table = self.query_one("#recent-tokens-table", DataTable)
-            table.clear(columns=True)
-
-            # Add columns
-            table.add_columns("Provider", "Type", "Status", "Expires", "Issued")
-
-            if not self.tokens:
-                table.add_row("No tokens found", "-", "-", "-", "-")
-                return
-
-            # Sort tokens by most recent first and take top 10
-            sorted_tokens = sorted(self.tokens, key=lambda t: t.get("issued_at", 0), reverse=True)[
-                :10
-            ]
-
-            for token in sorted_tokens:
-                provider = token.get("provider", "Unknown")
-                token_type = token.get("token_type", "Bearer")
-
-                # Determine status
-                status = self.get_token_status(token)
-
-                # Format expiration
-                expires_display = self.format_expiration(token)
-
-                # Format issued time
-                issued_display = self.format_issued_time(token)
+            table = Table(*_RECENT_COLUMNS, expand=True, row_styles=("", "dim"))
+            rows = snapshot.recent if snapshot.total_tokens else (_NO_TOKENS_ROW,)
+            for row in rows:
+                # Text cells, so provider names are never parsed as markup
+                table.add_row(*map(Text, row))
 
-                table.add_row(provider, token_type, status, expires_display, issued_display)
+            self.query_one("#recent-tokens-static", Static).update(table)
 
         except Exception as e:
             self.notify(f"Error updating tokens table: {str(e)}", severity="error")
 
-    def count_expired_tokens(self) -> int:
-        """Count the number of expired tokens."""
-        expired_count = 0
-        now = datetime.now()
-
-        for token in self.tokens:
-            expires_at = token.get("expires_at")
-            if expires_at:
-                try:
-                    if isinstance(expires_at, (int, float)):
-                        exp_time = datetime.fromtimestamp(expires_at)
-                    else:
-                        exp_time = datetime.fromisoformat(str(expires_at).replace("Z", "+00:00"))
-
-                    if exp_time <= now:
-                        expired_count += 1
-                except (ValueError, OSError):
-                    pass  # Invalid timestamp format
-
-        return expired_count
-
-    def get_system_status(self) -> str:
-        """Get the overall system status."""
+    def count_expired_tokens(self, now: float) -> int:
+        """Count the tokens expired at the POSIX time ``now``."""
+        return sum(1 for expires in self._expiry_times if expires <= now)
+
+    @staticmethod
+    def _collect_expiry_times(tokens: list[dict[str, Any]]) -> list[float]:
+        """Convert token expirations to POSIX times once per token change."""
+        expiry_times = []
+        for token in tokens:
+            exp_time = to_datetime(token.get("expires_at"))
+            if exp_time is None:
+                continue  # No or invalid timestamp
+            try:
+                # Naive datetimes are local time, as everywhere else here
+                expiry_times.append(exp_time.timestamp())
+            except (OSError, OverflowError):
+                continue  # Outside the platform's time_t range
+        return expiry_times
+
+    def get_system_status(self, expired: int) -> str:
+        """Get the overall system status, given the number of expired tokens."""
         if self.loading:
             return "Loading..."
 
-        expired_tokens = self.count_expired_tokens()
-        if expired_tokens > 0:
+        if expired > 0:
             return "Warning"
 
         if len(self.tokens) == 0 and len(self.providers) == 0:
@@ -396,79 +471,91 @@ class DashboardScreen(Screen):
 
         return "Ready"
 
-    def get_token_status(self, token: dict[str, Any]) -> str:
-        """Get the status of a token."""
-        expires_at = token.get("expires_at")
-        if not expires_at:
-            return "Active"
+    def get_token_status(self, token: dict[str, Any], now: datetime, now_utc: datetime) -> str:
+        """Get the status of a token.
 
-        try:
-            if isinstance(expires_at, (int, float)):
-                exp_time = datetime.fromtimestamp(expires_at)
-            else:
-                exp_time = datetime.fromisoformat(str(expires_at).replace("Z", "+00:00"))
-
-            now = datetime.now(exp_time.tzinfo) if exp_time.tzinfo else datetime.now()
-
-            if exp_time <= now:
-                return "Expired"
-            if exp_time <= now + timedelta(hours=1):
-                return "Expiring"
-            return "Active"
-        except (ValueError, OSError):
-            return "Unknown"
-
-    def format_expiration(self, token: dict[str, Any]) -> str:
-        """Format token expiration time."""
+        Args:
+            token: Token data
+            now: Current naive local time, compared with naive timestamps
+            now_utc: Current aware UTC time, compared with aware timestamps
+        """
         expires_at = token.get("expires_at")
-        if not expires_at:
-            return "Never"
-
-        try:
-            if isinstance(expires_at, (int, float)):
-                exp_time = datetime.fromtimestamp(expires_at)
-            else:
-                exp_time = datetime.fromisoformat(str(expires_at).replace("Z", "+00:00"))
-
-            now = datetime.now(exp_time.tzinfo) if exp_time.tzinfo else datetime.now()
-
-            if exp_time <= now:
-                return "Expired"
-
-            # Calculate remaining time
-            remaining = exp_time - now
-            if remaining.days > 0:
-                return f"{remaining.days}d {remaining.seconds // 3600}h"
-            if remaining.seconds > 3600:
-                return f"{remaining.seconds // 3600}h {(remaining.seconds % 3600) // 60}m"
-            return f"{remaining.seconds // 60}m"
-
-        except (ValueError, OSError):
-            return str(expires_at)
-
-    def format_issued_time(self, token: dict[str, Any]) -> str:
-        """Format token issued time."""
+        exp_time = to_datetime(expires_at)
+        if exp_time is None:
+            return "Unknown" if expires_at else "Active"
+
+        if exp_time.tzinfo:
+            now = now_utc
+
+        if exp_time <= now:
+            return "Expired"
+        if exp_time <= now + _ONE_HOUR:
+            return "Expiring"
+        return "Active"
+
+    def format_expiration(self, token: dict[str, Any], now: datetime, now_utc: datetime) -> str:
+        """Format token expiration time.
+
+        Args:
+            token: Token data
+            now: Current naive local time, compared with naive timestamps
+            now_utc: Current aware UTC time, compared with aware timestamps
+        """
+        expires_at = token.get("expires_at")
+        exp_time = to_datetime(expires_at)
+        if exp_time is None:
+            return str(expires_at) if expires_at else "Never"
+
+        if exp_time.tzinfo:
+            now = now_utc
+
+        if exp_time <= now:
+            return "Expired"
+
+        # Calculate remaining time
+        remaining = exp_time - now
+        if remaining.days > 0:
+            return f"{remaining.days}d {remaining.seconds // 3600}h"
+        if remaining.seconds > 3600:
+            return f"{remaining.seconds // 3600}h {(remaining.seconds % 3600) // 60}m"
+        return f"{remaining.seconds // 60}m"
+
+    def format_issued_time(self, token: dict[str, Any], now: datetime, now_utc: datetime) -> str:
+        """Format token issued time.
+
+        Args:
+            token: Token data
+            now: Current naive local time, compared with naive timestamps
+            now_utc: Current aware UTC time, compared with aware timestamps
+        """
         issued_at = token.get("issued_at")
-        if not issued_at:
-            return "Unknown"
-
-        try:
-            if isinstance(issued_at, (int, float)):
-                issued_time = datetime.fromtimestamp(issued_at)
-            else:
-                issued_time = datetime.fromisoformat(str(issued_at).replace("Z", "+00:00"))
-
-            now = datetime.now(issued_time.tzinfo) if issued_time.tzinfo else datetime.now()
-            diff = now - issued_time
-
-            if diff.days > 0:
-                return f"{diff.days}d ago"
-            if diff.seconds > 3600:
-                return f"{diff.seconds // 3600}h ago"
-            return f"{diff.seconds // 60}m ago"
+        issued_time = to_datetime(issued_at)
+        if issued_time is None:
+            return str(issued_at) if issued_at else "Unknown"
+
+        if issued_time.tzinfo:
+            now = now_utc
+        diff = now - issued_time
+
+        if diff.days > 0:
+            return f"{diff.days}d ago"
+        if diff.seconds > 3600:
+            return f"{diff.seconds // 3600}h ago"
+        return f"{diff.seconds // 60}m ago"
+
+    def request_refresh(self) -> None:
+        """Reload the data, coalescing repeated requests within the refresh interval."""
+        if self._refresh_timer is not None:
+            self._refresh_pending = True
+            return
+        self.load_dashboard_data()
+        self._refresh_timer = self.set_timer(_REFRESH_INTERVAL, self._end_refresh_interval)
 
-        except (ValueError, OSError):
-            return str(issued_at)
+    def _end_refresh_interval(self) -> None:
+        self._refresh_timer = None
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.request_refresh()
 
     @work(exclusive=True)
     async def load_dashboard_data(self) -> None:
@@ -478,34 +565,31 @@ class DashboardScreen(Screen):
             oauth_client = cast("OAuthTUI", self.app).oauth_client
 
             # Load tokens and providers in parallel
-            tokens, providers = await oauth_client.get_tokens(), await oauth_client.get_providers()
+            tokens, providers = await asyncio.gather(
+                oauth_client.get_tokens(), oauth_client.get_providers()
+            )
+        except Exception as e:
+            self.notify(f"Error loading dashboard data: {str(e)}", severity="error")
+            tokens, providers = [], []
+        else:
+            self.notify("Dashboard data loaded", severity="information")
 
+        # Apply all state changes as one screen update
+        with self.app.batch_update():
             self.tokens = tokens
             self.providers = providers
-
-            # Update stats
-            self.stats = {
-                "total_tokens": len(tokens),
-                "total_providers": len(providers),
-                "expired_tokens": self.count_expired_tokens(),
-                "system_status": self.get_system_status(),
-            }
-
-            self.notify("Dashboard data loaded", severity="information")
-
-        except Exception as e:
-            self.notify(f"Error loading dashboard data: {str(e)}", severity="error")
-            self.tokens = []
-            self.providers = []
-            self.stats = {}
-        finally:
             self.loading = False
 
+            # Every widget below renders from this one snapshot
+            snapshot = self.take_snapshot()
+            self.update_stat_cards(snapshot)
+            self.update_recent_tokens_table(snapshot)
+
     # Button event handlers
     @on(Button.Pressed, "#refresh")
     def on_refresh_pressed(self) -> None:
         """Handle refresh button press."""
-        self.load_dashboard_data()
+        self.request_refresh()
 
     @on(Button.Pressed, "#tokens")
     @on(Button.Pressed, "#quick_tokens")
@@ -543,37 +627,27 @@ class DashboardScreen(Screen):
     # Action methods
     def action_refresh(self) -> None:
         """Refresh dashboard data."""
-        self.load_dashboard_data()
+        self.request_refresh()
 
     def action_show_tokens(self) -> None:
         """Show the tokens screen."""
-        from .tokens import TokensScreen
-
-        self.app.push_screen(TokensScreen())
+        self.app.push_screen(_screen_class("tokens", "TokensScreen")())
 
     def action_show_auth(self) -> None:
         """Show the authentication screen."""
-        from .auth import AuthScreen
-
-        self.app.push_screen(AuthScreen())
+        self.app.push_screen(_screen_class("auth", "AuthScreen")())
 
     def action_show_config(self) -> None:
         """Show the configuration screen."""
-        from .config import ConfigScreen
-
-        self.app.push_screen(ConfigScreen())
+        self.app.push_screen(_screen_class("config", "ConfigScreen")())
 
     def action_show_inspector(self) -> None:
         """Show the token inspector screen."""
-        from .inspector import InspectorScreen
-
-        self.app.push_screen(InspectorScreen())
+        self.app.push_screen(_screen_class("inspector", "InspectorScreen")())
 
     def action_show_help(self) -> None:
         """Show the help screen."""
-        from .help import HelpScreen
-
-        self.app.push_screen(HelpScreen())
+        self.app.push_screen(_screen_class("help", "HelpScreen")())
 
     def action_back(self) -> None:
         """Go back to previous screen."""
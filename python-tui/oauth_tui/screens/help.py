@@ -5,6 +5,21 @@ from textual.containers import Container, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Static
 
+# Rendered as a single widget; the text never changes
+_HELP_TEXT = "\n".join(
+    (
+        "\nKeyboard Shortcuts:",
+        "  • Arrow keys - Navigate menu items",
+        "  • Enter - Select item",
+        "  • Escape - Go back",
+        "  • Ctrl+Q or Ctrl+C - Quit application",
+        "  • ? - Show this help screen",
+        "\nNavigation:",
+        "  • Use the menu to access different features",
+        "  • Press Escape to return to the main menu",
+    )
+)
+
 
 class HelpScreen(Screen):
     """Help screen with usage information."""
@@ -21,15 +36,7 @@ class HelpScreen(Screen):
             yield Static("❓ Help", classes="screen-title")
 
             with Vertical():
-                yield Static("\nKeyboard Shortcuts:")
-                yield Static("  • Arrow keys - Navigate menu items")
-                yield Static("  • Enter - Select item")
-                yield Static("  • Escape - Go back")
-                yield Static("  • Ctrl+Q or Ctrl+C - Quit application")
-                yield Static("  • ? - Show this help screen")
-                yield Static("\nNavigation:")
-                yield Static("  • Use the menu to access different features")
-                yield Static("  • Press Escape to return to the main menu")
+                yield Static(_HELP_TEXT)
 
             yield Button("← Back to Menu", id="back", variant="primary")
 
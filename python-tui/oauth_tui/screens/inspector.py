@@ -1,7 +1,11 @@
 """Token inspector screen for OAuth TUI."""
 
-import base64
-import json
+import asyncio
+import binascii
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from textual import on, work
@@ -22,9 +26,68 @@ from textual.widgets import (
     TextArea,
 )
 
+from ..utils import fastjson
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - pybase64 is an optional speedup
+    pybase64 = None  # type: ignore[assignment, unused-ignore]
+
 if TYPE_CHECKING:
     pass
 
+# Signing algorithm families reported by analyze_jwt
+_HMAC_ALGS = frozenset({"HS256", "HS384", "HS512"})
+_RSA_ALGS = frozenset({"RS256", "RS384", "RS512"})
+_ECDSA_ALGS = frozenset({"ES256", "ES384", "ES512"})
+
+# Scroll containers of the Header, Payload, Signature and Analysis tabs
+_TAB_CONTENT_IDS = ("header-content", "payload-content", "signature-content", "analysis-content")
+
+# Optional analysis fields shown in the Analysis tab, in display order
+_ANALYSIS_FIELDS = (
+    ("key_id", "Key ID"),
+    ("issuer", "Issuer"),
+    ("subject", "Subject"),
+    ("audience", "Audience"),
+    ("scopes", "Scopes"),
+)
+_ANALYSIS_TIMES = (("issued_at", "Issued At"), ("expiration", "Expires At"))
+
+# Sample JWT token (not a real token, just for demonstration)
+_SAMPLE_TOKEN = (
+    "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCIsImtpZCI6IjEyMzQ1Njc4OTAifQ."
+    "eyJzdWIiOiIxMjM0NTY3ODkwIiwibmFtZSI6IkpvaG4gRG9lIiwiYWRtaW4iOnRydWUsImF1ZCI6ImV4YW1w"
+    "bGUtYXBwIiwiaXNzIjoiaHR0cHM6Ly9leGFtcGxlLmNvbSIsImlhdCI6MTYxNjIzOTAyMiwiZXhwIjoxNjE2"
+    "MjQyNjIyLCJzY29wZSI6InJlYWQgd3JpdGUgYWRtaW4ifQ."
+    "signature-placeholder"
+)
+
+# Three base64url parts; the signature is empty for unsigned tokens
+_JWT_RE = re.compile(r"[A-Za-z0-9_-]+=*\.[A-Za-z0-9_-]+=*\.[A-Za-z0-9_-]*=*")
+
+
+# Maps the URL-safe base64 alphabet onto the standard one
+_URLSAFE_TO_STD = bytes.maketrans(b"-_", b"+/")
+
+
+def _urlsafe_b64decode(data: str) -> bytes:
+    """Decode unpadded URL-safe base64, as used by JWT parts."""
+    pad = -len(data) & 3
+    if pybase64 is not None:
+        return pybase64.urlsafe_b64decode(data + "=" * pad)
+    # What base64.urlsafe_b64decode does, without its Python-level wrappers
+    return binascii.a2b_base64(data.encode("ascii").translate(_URLSAFE_TO_STD) + b"=" * pad)
+
+
+@lru_cache(maxsize=64)
+def _decode_jwt_json(encoded_part: str) -> dict[str, Any]:
+    """Decode a base64url JSON part; re-parsing the same token hits the cache.
+
+    The returned dict is shared between calls and must not be modified.
+    """
+    return fastjson.loads(_urlsafe_b64decode(encoded_part))
+
 
 class InspectorScreen(Screen):
     """Token inspector screen for JWT analysis."""
@@ -136,11 +199,14 @@ class InspectorScreen(Screen):
     """
 
     # Reactive attributes for state management
-    loading: reactive[bool] = reactive(False)
-    jwt_token: reactive[str] = reactive("")
+    loading: reactive[bool] = reactive(False, init=False)
     parsed_data: reactive[dict[str, Any] | None] = reactive(None)
     parse_error: reactive[str | None] = reactive(None)
 
+    _loading_indicator: LoadingIndicator
+    _token_input: TextArea
+    _tab_containers: dict[str, VerticalScroll]
+
     def compose(self) -> ComposeResult:
         """Compose the inspector screen layout."""
         yield Header(show_clock=True)
@@ -200,10 +266,17 @@ class InspectorScreen(Screen):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Cache the widgets that are updated on every parse."""
+        self._loading_indicator = self.query_one("#loading", LoadingIndicator)
+        self._token_input = self.query_one("#token-input", TextArea)
+        self._tab_containers = {
+            tab_id: self.query_one(f"#{tab_id}", VerticalScroll) for tab_id in _TAB_CONTENT_IDS
+        }
+
     def watch_loading(self, loading: bool) -> None:
         """React to loading state changes."""
-        loading_indicator = self.query_one("#loading", LoadingIndicator)
-        loading_indicator.display = loading
+        self._loading_indicator.display = loading
 
     def watch_parsed_data(self, parsed_data: dict[str, Any] | None) -> None:
         """React to parsed data changes."""
@@ -235,41 +308,26 @@ class InspectorScreen(Screen):
         """Handle back button press."""
         self.app.pop_screen()
 
-    @on(TextArea.Changed, "#token-input")
-    def on_token_input_changed(self, event: TextArea.Changed) -> None:
-        """Handle token input changes."""
-        self.jwt_token = event.text_area.text
-
     def clear_input(self) -> None:
         """Clear the token input."""
-        token_input = self.query_one("#token-input", TextArea)
-        token_input.text = ""
-        self.jwt_token = ""
+        self._token_input.text = ""
         self.parsed_data = None
         self.parse_error = None
         self.clear_output_tabs()
+        # Don't keep decoded claims around once the user has cleared them
+        _decode_jwt_json.cache_clear()
         self.notify("Input cleared", severity="information")
 
     def load_sample_token(self) -> None:
         """Load a sample JWT token for demonstration."""
-        # Sample JWT token (not a real token, just for demonstration)
-        sample_token = (
-            "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCIsImtpZCI6IjEyMzQ1Njc4OTAifQ."
-            "eyJzdWIiOiIxMjM0NTY3ODkwIiwibmFtZSI6IkpvaG4gRG9lIiwiYWRtaW4iOnRydWUsImF1ZCI6ImV4YW1w"
-            "bGUtYXBwIiwiaXNzIjoiaHR0cHM6Ly9leGFtcGxlLmNvbSIsImlhdCI6MTYxNjIzOTAyMiwiZXhwIjoxNjE2"
-            "MjQyNjIyLCJzY29wZSI6InJlYWQgd3JpdGUgYWRtaW4ifQ."
-            "signature-placeholder"
-        )
-
-        token_input = self.query_one("#token-input", TextArea)
-        token_input.text = sample_token
-        self.jwt_token = sample_token
+        self._token_input.text = _SAMPLE_TOKEN
         self.notify("Sample token loaded", severity="information")
 
     @work(exclusive=True)
     async def parse_token(self) -> None:
         """Parse the JWT token."""
-        token = self.jwt_token.strip()
+        # Read the input only when parsing, not on every keystroke
+        token = self._token_input.text.strip()
         if not token:
             self.notify("Please enter a JWT token", severity="warning")
             return
@@ -278,7 +336,8 @@ class InspectorScreen(Screen):
         self.parse_error = None
 
         try:
-            parsed = self.parse_jwt_token(token)
+            # Decode off the event loop so large tokens don't stall the UI
+            parsed = await asyncio.to_thread(self.parse_jwt_token, token)
             self.parsed_data = parsed
             self.notify("Token parsed successfully", severity="information")
         except Exception as e:
@@ -287,7 +346,8 @@ class InspectorScreen(Screen):
         finally:
             self.loading = False
 
-    def parse_jwt_token(self, token: str) -> dict[str, Any]:
+    @staticmethod
+    def parse_jwt_token(token: str) -> dict[str, Any]:
         """
         Parse a JWT token into its components.
 
@@ -305,20 +365,24 @@ class InspectorScreen(Screen):
         if len(parts) != 3:
             raise ValueError("Invalid JWT format. JWT should have 3 parts separated by dots.")
 
+        # Reject stray characters before doing any decoding
+        if not _JWT_RE.fullmatch(token):
+            raise ValueError("Invalid JWT format. Token contains non-base64url characters.")
+
         header_encoded, payload_encoded, signature_encoded = parts
 
         try:
             # Decode header
-            header = self.decode_jwt_part(header_encoded)
+            header = InspectorScreen.decode_jwt_part(header_encoded)
 
             # Decode payload
-            payload = self.decode_jwt_part(payload_encoded)
+            payload = InspectorScreen.decode_jwt_part(payload_encoded)
 
             # Signature (keep as base64)
             signature = signature_encoded
 
             # Extract metadata and perform analysis
-            analysis = self.analyze_jwt(header, payload)
+            analysis = InspectorScreen.analyze_jwt(header, payload, int(time.time()))
 
             return {
                 "header": header,
@@ -335,7 +399,8 @@ class InspectorScreen(Screen):
         except Exception as e:
             raise ValueError(f"Failed to decode JWT: {str(e)}")
 
-    def decode_jwt_part(self, encoded_part: str) -> dict[str, Any]:
+    @staticmethod
+    def decode_jwt_part(encoded_part: str) -> dict[str, Any]:
         """
         Decode a JWT part (header or payload).
 
@@ -345,231 +410,157 @@ class InspectorScreen(Screen):
         Returns:
             Decoded JSON object
         """
-        # Add padding if necessary
-        missing_padding = len(encoded_part) % 4
-        if missing_padding:
-            encoded_part += "=" * (4 - missing_padding)
-
         try:
-            # Decode base64
-            decoded_bytes = base64.urlsafe_b64decode(encoded_part)
-            decoded_str = decoded_bytes.decode("utf-8")
-
-            # Parse JSON
-            return json.loads(decoded_str)
+            # Decode base64 and parse the JSON straight from the UTF-8 bytes
+            return _decode_jwt_json(encoded_part)
         except Exception as e:
             raise ValueError(f"Failed to decode part: {str(e)}")
 
-    def analyze_jwt(self, header: dict[str, Any], payload: dict[str, Any]) -> dict[str, Any]:
+    @staticmethod
+    def analyze_jwt(header: dict[str, Any], payload: dict[str, Any], now: int) -> dict[str, Any]:
         """
         Analyze JWT header and payload for insights.
 
         Args:
             header: Decoded JWT header
             payload: Decoded JWT payload
+            now: Current Unix time, used for the expiration checks
 
         Returns:
             Analysis results
         """
+        header_get = header.get
+        claim = payload.get
+        alg = header_get("alg", "Unknown")
+        expiration = claim("exp")
+        warnings: list[str] = []
+        info: list[str] = []
         analysis = {
-            "algorithm": header.get("alg", "Unknown"),
-            "token_type": header.get("typ", "Unknown"),
-            "key_id": header.get("kid"),
-            "issuer": payload.get("iss"),
-            "subject": payload.get("sub"),
-            "audience": payload.get("aud"),
-            "expiration": payload.get("exp"),
-            "issued_at": payload.get("iat"),
-            "not_before": payload.get("nbf"),
-            "scopes": payload.get("scope"),
-            "warnings": [],
-            "info": [],
+            "algorithm": alg,
+            "token_type": header_get("typ", "Unknown"),
+            "key_id": header_get("kid"),
+            "issuer": claim("iss"),
+            "subject": claim("sub"),
+            "audience": claim("aud"),
+            "expiration": expiration,
+            "issued_at": claim("iat"),
+            "not_before": claim("nbf"),
+            "scopes": claim("scope"),
+            "warnings": warnings,
+            "info": info,
         }
 
         # Check for common issues
-        if analysis["algorithm"] == "none":
-            analysis["warnings"].append("Algorithm is 'none' - this is insecure!")
+        if alg == "none":
+            warnings.append("Algorithm is 'none' - this is insecure!")
 
         if not analysis["issuer"]:
-            analysis["warnings"].append("No issuer (iss) claim found")
+            warnings.append("No issuer (iss) claim found")
 
-        if not analysis["expiration"]:
-            analysis["warnings"].append("No expiration (exp) claim found")
+        if not expiration:
+            warnings.append("No expiration (exp) claim found")
 
         # Check expiration
-        if analysis["expiration"]:
-            import time
-
-            current_time = int(time.time())
-            if analysis["expiration"] < current_time:
-                analysis["warnings"].append("Token has expired")
+        if expiration:
+            if expiration < now:
+                warnings.append("Token has expired")
             else:
-                remaining = analysis["expiration"] - current_time
-                analysis["info"].append(f"Token expires in {remaining} seconds")
+                remaining = expiration - now
+                info.append(f"Token expires in {remaining} seconds")
 
         # Check algorithm security
-        if analysis["algorithm"] in ["HS256", "HS384", "HS512"]:
-            analysis["info"].append("HMAC algorithm - symmetric key")
-        elif analysis["algorithm"] in ["RS256", "RS384", "RS512"]:
-            analysis["info"].append("RSA algorithm - asymmetric key")
-        elif analysis["algorithm"] in ["ES256", "ES384", "ES512"]:
-            analysis["info"].append("ECDSA algorithm - asymmetric key")
+        if alg in _HMAC_ALGS:
+            info.append("HMAC algorithm - symmetric key")
+        elif alg in _RSA_ALGS:
+            info.append("RSA algorithm - asymmetric key")
+        elif alg in _ECDSA_ALGS:
+            info.append("ECDSA algorithm - asymmetric key")
 
         return analysis
 
-    def format_json_for_display(self, data: Any, indent: int = 0) -> str:
-        """Format JSON data for display with syntax highlighting simulation."""
-        if isinstance(data, dict):
-            lines = ["{"]
-            items = list(data.items())
-            for i, (key, value) in enumerate(items):
-                comma = "," if i < len(items) - 1 else ""
-                if isinstance(value, (dict, list)):
-                    lines.append(
-                        f'  {"  " * indent}"{key}": '
-                        f"{self.format_json_for_display(value, indent + 1)}{comma}"
-                    )
-                else:
-                    lines.append(f'  {"  " * indent}"{key}": {json.dumps(value)}{comma}')
-            lines.append(f"{'  ' * indent}}}")
-            return "\n".join(lines)
-        if isinstance(data, list):
-            if not data:
-                return "[]"
-            lines = ["["]
-            for i, item in enumerate(data):
-                comma = "," if i < len(data) - 1 else ""
-                lines.append(
-                    f"  {'  ' * indent}{self.format_json_for_display(item, indent + 1)}{comma}"
-                )
-            lines.append(f"{'  ' * indent}]")
-            return "\n".join(lines)
-        return json.dumps(data)
-
     def update_output_tabs(self, parsed_data: dict[str, Any]) -> None:
-        """Update all output tabs with parsed data."""
-        # Update header tab
-        header_content = self.query_one("#header-content", VerticalScroll)
-        header_content.remove_children()
-        header_content.mount(
-            Static("JWT Header:", classes="section-title"),
-            Static(self.format_json_for_display(parsed_data["header"]), classes="json-text"),
-        )
-
-        # Update payload tab
-        payload_content = self.query_one("#payload-content", VerticalScroll)
-        payload_content.remove_children()
-        payload_content.mount(
-            Static("JWT Payload:", classes="section-title"),
-            Static(self.format_json_for_display(parsed_data["payload"]), classes="json-text"),
-        )
-
-        # Update signature tab
-        signature_content = self.query_one("#signature-content", VerticalScroll)
-        signature_content.remove_children()
-        signature_content.mount(
-            Static("JWT Signature:", classes="section-title"),
-            Static(f"Base64 Encoded: {parsed_data['signature']}", classes="value"),
-            Static(
-                "\nNote: Signature verification requires the secret key or public key",
-                classes="warning-text",
-            ),
-        )
-
-        # Update analysis tab
-        analysis_content = self.query_one("#analysis-content", VerticalScroll)
-        analysis_content.remove_children()
+        """Update all output tabs with parsed data.
 
+        Text taken from the token is shown with markup=False: it is displayed
+        verbatim, and a claim such as "[/x]" can't break rendering.
+        """
         analysis = parsed_data["analysis"]
-        widgets = [Static("Token Analysis:", classes="section-title")]
 
-        # Basic info
+        widgets = [
+            Static("Token Analysis:", classes="section-title"),
+            Static(f"Algorithm: {analysis['algorithm']}", classes="value", markup=False),
+            Static(f"Type: {analysis['token_type']}", classes="value", markup=False),
+        ]
         widgets.extend(
-            [
-                Static(f"Algorithm: {analysis['algorithm']}", classes="value"),
-                Static(f"Type: {analysis['token_type']}", classes="value"),
-            ]
+            Static(f"{label}: {analysis[key]}", classes="value", markup=False)
+            for key, label in _ANALYSIS_FIELDS
+            if analysis.get(key)
         )
-
-        if analysis.get("key_id"):
-            widgets.append(Static(f"Key ID: {analysis['key_id']}", classes="value"))
-
-        if analysis.get("issuer"):
-            widgets.append(Static(f"Issuer: {analysis['issuer']}", classes="value"))
-
-        if analysis.get("subject"):
-            widgets.append(Static(f"Subject: {analysis['subject']}", classes="value"))
-
-        if analysis.get("audience"):
-            widgets.append(Static(f"Audience: {analysis['audience']}", classes="value"))
-
-        if analysis.get("scopes"):
-            widgets.append(Static(f"Scopes: {analysis['scopes']}", classes="value"))
-
-        # Timestamps
-        if analysis.get("issued_at"):
-            from datetime import datetime
-
-            iat_time = datetime.fromtimestamp(analysis["issued_at"])
-            widgets.append(
-                Static(f"Issued At: {iat_time.strftime('%Y-%m-%d %H:%M:%S')}", classes="value")
-            )
-
-        if analysis.get("expiration"):
-            from datetime import datetime
-
-            exp_time = datetime.fromtimestamp(analysis["expiration"])
-            widgets.append(
-                Static(f"Expires At: {exp_time.strftime('%Y-%m-%d %H:%M:%S')}", classes="value")
+        widgets.extend(
+            Static(
+                f"{label}: {datetime.fromtimestamp(analysis[key]).isoformat(' ', 'seconds')}",
+                classes="value",
             )
+            for key, label in _ANALYSIS_TIMES
+            if analysis.get(key)
+        )
 
-        # Warnings
         if analysis.get("warnings"):
             widgets.append(Static("\nWarnings:", classes="section-title"))
-            for warning in analysis["warnings"]:
-                widgets.append(Static(f"⚠️  {warning}", classes="warning-text"))
+            widgets.extend(
+                Static(f"⚠️  {warning}", classes="warning-text") for warning in analysis["warnings"]
+            )
 
-        # Info
         if analysis.get("info"):
             widgets.append(Static("\nInformation:", classes="section-title"))
-            for info in analysis["info"]:
-                widgets.append(Static(f"ℹ️  {info}", classes="info-text"))
+            widgets.extend(Static(f"ℹ️  {info}", classes="info-text") for info in analysis["info"])
+
+        tabs = {
+            "header-content": [
+                Static("JWT Header:", classes="section-title"),
+                Static(
+                    fastjson.dumps_pretty(parsed_data["header"]), classes="json-text", markup=False
+                ),
+            ],
+            "payload-content": [
+                Static("JWT Payload:", classes="section-title"),
+                Static(
+                    fastjson.dumps_pretty(parsed_data["payload"]), classes="json-text", markup=False
+                ),
+            ],
+            "signature-content": [
+                Static("JWT Signature:", classes="section-title"),
+                Static(f"Base64 Encoded: {parsed_data['signature']}", classes="value"),
+                Static(
+                    "\nNote: Signature verification requires the secret key or public key",
+                    classes="warning-text",
+                ),
+            ],
+            "analysis-content": widgets,
+        }
 
-        analysis_content.mount(*widgets)
+        # Swap the contents of all four tabs in a single screen update
+        with self.app.batch_update():
+            for tab_id, children in tabs.items():
+                content = self._tab_containers[tab_id]
+                content.remove_children()
+                content.mount(*children)
 
     def show_error(self, error: str) -> None:
         """Show error in all tabs."""
-        error_widget = Static(f"Parse Error: {error}", classes="error-text")
-
-        for tab_id in [
-            "header-content",
-            "payload-content",
-            "signature-content",
-            "analysis-content",
-        ]:
-            try:
-                content = self.query_one(f"#{tab_id}", VerticalScroll)
-                content.remove_children()
-                content.mount(error_widget)
-            except Exception:
-                pass  # Tab might not exist yet
+        self._fill_tabs(f"Parse Error: {error}", "error-text")
 
     def clear_output_tabs(self) -> None:
         """Clear all output tabs."""
-        default_widget = Static("Parse a JWT token to see the content", classes="info-text")
-
-        for tab_id in [
-            "header-content",
-            "payload-content",
-            "signature-content",
-            "analysis-content",
-        ]:
-            try:
-                content = self.query_one(f"#{tab_id}", VerticalScroll)
+        self._fill_tabs("Parse a JWT token to see the content", "info-text")
+
+    def _fill_tabs(self, message: str, classes: str) -> None:
+        """Replace the contents of every tab with a single message."""
+        with self.app.batch_update():
+            for content in self._tab_containers.values():
                 content.remove_children()
-                content.mount(default_widget)
-            except Exception:
-                pass  # Tab might not exist yet
+                # A widget can only be mounted once, so each tab gets its own
+                content.mount(Static(message, classes=classes, markup=False))
 
     def action_back(self) -> None:
         """Go back to previous screen."""
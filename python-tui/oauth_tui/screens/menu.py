@@ -6,6 +6,16 @@ from textual.containers import Container, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Static
 
+# Menu button ids and the installed screens they open
+_MENU_ROUTES = {
+    "dashboard": "dashboard",
+    "auth": "auth",
+    "tokens": "tokens",
+    "config": "config",
+    "inspect": "inspector",
+    "help": "help",
+}
+
 
 class MenuScreen(Screen):
     """Main menu screen with navigation options."""
@@ -84,18 +94,8 @@ class MenuScreen(Screen):
 
         if button_id == "exit":
             self.app.exit()
-        elif button_id == "tokens":
-            self.app.push_screen("tokens")
-        elif button_id == "auth":
-            self.app.push_screen("auth")
-        elif button_id == "config":
-            self.app.push_screen("config")
-        elif button_id == "inspect":
-            self.app.push_screen("inspector")
-        elif button_id == "dashboard":
-            self.app.push_screen("dashboard")
-        elif button_id == "help":
-            self.app.push_screen("help")
+        elif button_id is not None and (screen := _MENU_ROUTES.get(button_id)):
+            self.app.push_screen(screen)
 
     def action_view_tokens(self) -> None:
         """Navigate to tokens screen."""
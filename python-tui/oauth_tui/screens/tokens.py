@@ -11,8 +11,60 @@ from textual.reactive import reactive
 from textual.screen import Screen
 from textual.widgets import Button, DataTable, Footer, Header, LoadingIndicator, Static
 
+from ..utils.timestamps import current_times, to_datetime
+from ..widgets.table_rows import TableRows
+
 if TYPE_CHECKING:
     from ..app import OAuthTUI
+    from ..services.oauth_client import OAuthClient
+
+_COLUMNS = ("Provider", "Type", "Status", "Expires", "Scopes")
+_PLACEHOLDER = ("No tokens stored", "-", "-", "-", "-")
+
+# Fields action_view_details shows on their own lines
+_STANDARD_KEYS = frozenset(
+    {"provider", "token_type", "access_token", "refresh_token", "expires_at", "scope"}
+)
+
+
+def _token_row(token: dict[str, Any], now: datetime, now_utc: datetime) -> tuple[str, ...]:
+    """Build the table cells for a token.
+
+    Args:
+        token: Token data
+        now: Current naive local time, compared with naive timestamps
+        now_utc: Current aware UTC time, compared with aware timestamps
+    """
+    provider = token.get("provider", "Unknown")
+    token_type = token.get("token_type", "Bearer")
+
+    # Determine token status
+    expires_at = token.get("expires_at")
+    status = "Active"
+    expires_display = "N/A"
+
+    exp_time = to_datetime(expires_at)
+    if exp_time is None:
+        if expires_at:
+            expires_display = str(expires_at)  # Invalid timestamp format
+    else:
+        # Calculate remaining time in whole seconds
+        remaining = int((exp_time - (now_utc if exp_time.tzinfo else now)).total_seconds())
+
+        if remaining <= 0:
+            status = "Expired"
+        elif remaining >= 86400:
+            expires_display = f"{remaining // 86400}d {remaining % 86400 // 3600}h"
+        elif remaining > 3600:
+            expires_display = f"{remaining // 3600}h {remaining % 3600 // 60}m"
+        else:
+            expires_display = f"{remaining // 60}m"
+
+    scopes = token.get("scope", "N/A")
+    if isinstance(scopes, list):
+        scopes = " ".join(scopes)
+
+    return (provider, token_type, status, expires_display, str(scopes))
 
 
 class TokensScreen(Screen):
@@ -92,10 +144,19 @@ class TokensScreen(Screen):
     """
 
     # Reactive attributes for state management
-    loading: reactive[bool] = reactive(False)
+    loading: reactive[bool] = reactive(False, init=False)
     tokens: reactive[list[dict[str, Any]]] = reactive([])
     selected_token_index: reactive[int | None] = reactive(None)
 
+    _table: DataTable
+    _loading_indicator: LoadingIndicator
+    _status_text: Static
+    # Resolved on first use, inside the callers' error handling, since creating
+    # the client fails when the Node.js CLI hasn't been built
+    _oauth_client: "OAuthClient | None" = None
+    # Table rows as last rendered, parallel to self.tokens
+    _rows: TableRows
+
     def compose(self) -> ComposeResult:
         """Compose the tokens screen layout."""
         yield Header(show_clock=True)
@@ -114,6 +175,12 @@ class TokensScreen(Screen):
             table: DataTable = DataTable(id="tokens-table")
             table.cursor_type = "row"
             table.zebra_stripes = True
+            self._table = table
+            self._rows = TableRows(
+                table,
+                table.add_columns(*_COLUMNS),
+                placeholder=_PLACEHOLDER,
+            )
             yield table
 
             # Button bar
@@ -128,15 +195,22 @@ class TokensScreen(Screen):
 
     def on_mount(self) -> None:
         """Load tokens when screen is mounted."""
+        self._loading_indicator = self.query_one("#loading", LoadingIndicator)
+        self._status_text = self.query_one("#status-text", Static)
         self.load_tokens()
 
+    def _get_oauth_client(self) -> "OAuthClient":
+        """Return the app's OAuth client, looking it up only once."""
+        if self._oauth_client is None:
+            self._oauth_client = cast("OAuthTUI", self.app).oauth_client
+        return self._oauth_client
+
     def watch_loading(self, loading: bool) -> None:
         """React to loading state changes."""
-        loading_indicator = self.query_one("#loading", LoadingIndicator)
-        loading_indicator.display = loading
+        self._loading_indicator.display = loading
 
         # Update status text
-        status_text = self.query_one("#status-text", Static)
+        status_text = self._status_text
         if loading:
             status_text.update("Loading tokens...")
         else:
@@ -151,68 +225,18 @@ class TokensScreen(Screen):
         self.update_table()
 
     def update_table(self) -> None:
-        """Update the tokens table display."""
-        table = self.query_one("#tokens-table", DataTable)
-        table.clear(columns=True)
-
-        # Add columns
-        table.add_columns("Provider", "Type", "Status", "Expires", "Scopes")
-
-        if not self.tokens:
-            table.add_row("No tokens stored", "-", "-", "-", "-")
-            return
-
-        for _i, token in enumerate(self.tokens):
-            provider = token.get("provider", "Unknown")
-            token_type = token.get("token_type", "Bearer")
-
-            # Determine token status
-            expires_at = token.get("expires_at")
-            status = "Active"
-            expires_display = "N/A"
-
-            if expires_at:
-                try:
-                    # Parse expiration time
-                    if isinstance(expires_at, (int, float)):
-                        # Unix timestamp
-                        exp_time = datetime.fromtimestamp(expires_at)
-                    else:
-                        # ISO string
-                        exp_time = datetime.fromisoformat(str(expires_at).replace("Z", "+00:00"))
-
-                    now = datetime.now(exp_time.tzinfo) if exp_time.tzinfo else datetime.now()
-
-                    if exp_time <= now:
-                        status = "Expired"
-                    else:
-                        # Calculate remaining time
-                        remaining = exp_time - now
-                        if remaining.days > 0:
-                            expires_display = f"{remaining.days}d {remaining.seconds // 3600}h"
-                        elif remaining.seconds > 3600:
-                            expires_display = (
-                                f"{remaining.seconds // 3600}h {(remaining.seconds % 3600) // 60}m"
-                            )
-                        else:
-                            expires_display = f"{remaining.seconds // 60}m"
-
-                except (ValueError, OSError):
-                    expires_display = str(expires_at)
-
-            scopes = token.get("scope", "N/A")
-            if isinstance(scopes, list):
-                scopes = " ".join(scopes)
-
-            table.add_row(provider, token_type, status, expires_display, str(scopes))
+        """Update the tokens table, touching only the rows that changed."""
+        # Apply every row change in a single screen update
+        with self.app.batch_update():
+            now, now_utc = current_times()
+            self._rows.sync([_token_row(token, now, now_utc) for token in self.tokens])
 
     @work(exclusive=True)
     async def load_tokens(self) -> None:
         """Load and display tokens from the OAuth CLI."""
         self.loading = True
         try:
-            oauth_client = cast("OAuthTUI", self.app).oauth_client
-            tokens = await oauth_client.get_tokens()
+            tokens = await self._get_oauth_client().get_tokens()
             self.tokens = tokens
             self.notify(f"Loaded {len(tokens)} tokens", severity="information")
         except Exception as e:
@@ -299,14 +323,7 @@ class TokensScreen(Screen):
 
         # Show additional fields
         for key, value in token.items():
-            if key not in [
-                "provider",
-                "token_type",
-                "access_token",
-                "refresh_token",
-                "expires_at",
-                "scope",
-            ]:
+            if key not in _STANDARD_KEYS:
                 details.append(f"{key.title()}: {value}")
 
         details_text = "\n".join(details)
@@ -329,7 +346,7 @@ class TokensScreen(Screen):
         self.notify("Token copied to clipboard (simulated)", severity="information")
 
     @work(exclusive=True)
-    async def delete_selected_token(self) -> None:
+    async def action_delete_token(self) -> None:
         """Delete the selected token."""
         token = self.get_selected_token()
         if not token:
@@ -338,9 +355,15 @@ class TokensScreen(Screen):
 
         provider = token.get("provider", "Unknown")
 
+        # Show confirmation
+        confirmed = await self.app.push_screen_wait(
+            ConfirmationScreen(f"Delete token for {provider}?", "This action cannot be undone.")
+        )
+        if not confirmed:
+            return
+
         try:
-            oauth_client = cast("OAuthTUI", self.app).oauth_client
-            success = await oauth_client.delete_token(provider)
+            success = await self._get_oauth_client().delete_token(provider)
 
             if success:
                 self.notify(f"Token for {provider} deleted successfully", severity="information")
@@ -350,25 +373,6 @@ class TokensScreen(Screen):
         except Exception as e:
             self.notify(f"Error deleting token: {str(e)}", severity="error")
 
-    def action_delete_token(self) -> None:
-        """Delete the selected token."""
-        token = self.get_selected_token()
-        if not token:
-            self.notify("No token selected", severity="warning")
-            return
-
-        provider = token.get("provider", "Unknown")
-
-        # Show confirmation
-        def confirm_delete(result: bool | None) -> None:
-            if result:
-                self.delete_selected_token()
-
-        self.app.push_screen(
-            ConfirmationScreen(f"Delete token for {provider}?", "This action cannot be undone."),
-            confirm_delete,
-        )
-
 
 class ConfirmationScreen(Screen):
     """Simple confirmation dialog screen."""
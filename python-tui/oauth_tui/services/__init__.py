@@ -1,6 +1,22 @@
 """Services for interacting with the Node.js OAuth CLI."""
 
-from .cli_bridge import CLIBridge
-from .oauth_client import OAuthClient
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cli_bridge import CLIBridge
+    from .oauth_client import OAuthClient
 
 __all__ = ["CLIBridge", "OAuthClient"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the services on first access rather than with the package."""
+    if name == "CLIBridge":
+        from .cli_bridge import CLIBridge
+
+        return CLIBridge
+    if name == "OAuthClient":
+        from .oauth_client import OAuthClient
+
+        return OAuthClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,58 @@
 
 import asyncio
 import json
+import os
+import re
+import signal
 from pathlib import Path
 from typing import Any
 
+from ..utils import fastjson
+
+# Seconds to wait for the RPC worker to answer a request
+_RPC_TIMEOUT = 30.0
+
+# Seconds close() gives the worker to exit after stdin closes, and then after SIGTERM
+_CLOSE_TIMEOUT = 1.0
+_TERM_TIMEOUT = 1.0
+
+# Windows has no SIGKILL; SIGTERM terminates the process outright there
+_SIGKILL = getattr(signal, "SIGKILL", signal.SIGTERM)
+
+# Longest reply line accepted from the worker; a token list carries whole JWTs,
+# well past asyncio's 64 KiB default
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+# Payloads larger than this many bytes are parsed in a worker thread
+_THREADED_PARSE_SIZE = 16384
+
+# Provider list heading: "<name> (<id>)"; the id is the last parenthesised part
+_PROVIDER_HEADING_RE = re.compile(r"(.*?)\s*\(([^()]*)\)")
+
+# Provider detail line: "<key>: <value>"
+_PROVIDER_DETAIL_RE = re.compile(r"([\w ]+?):\s+(.*)")
+
+# Header lines in the provider list that are neither headings nor details
+_PROVIDER_HEADERS = ("Configured providers:", "Available presets:")
+
+# Provider detail keys (normalized) -> provider dict fields
+_PROVIDER_FIELDS = {
+    "client_id": "client_id",
+    "token_url": "token_url",
+    "authorization_url": "auth_url",
+}
+
+
+async def _parse_json(data: bytes) -> Any:
+    """Parse JSON, off the event loop when the payload is large.
+
+    Small payloads are parsed inline, where handing them to a thread would cost
+    more than the parse itself.
+    """
+    if len(data) > _THREADED_PARSE_SIZE:
+        return await asyncio.to_thread(fastjson.loads, data)
+    return fastjson.loads(data)
+
 
 class CLIBridge:
     """Interface to Node.js OAuth CLI commands."""
@@ -21,6 +70,146 @@ class CLIBridge:
                 f"Node.js CLI not found at {self.cli_path}. Please run 'pnpm build' first."
             )
 
+        # Long-lived `cli.mjs --rpc` worker, started on the first request so Node.js
+        # startup is paid once per session instead of once per command
+        self._worker_cmd = ["node", str(self.cli_path), "--rpc"]
+        self._proc: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._next_id = 0
+
+    async def _ensure_worker(self) -> asyncio.subprocess.Process:
+        """Return the RPC worker, (re)starting it if it or its reader has stopped."""
+        proc = self._proc
+        if proc is not None and proc.returncode is None and self._reader is not None:
+            if not self._reader.done():
+                return proc
+            # The reader gave up on a worker that is still running; replace both
+            self._signal_worker(proc, _SIGKILL)
+            await proc.wait()
+
+        self._proc = await asyncio.create_subprocess_exec(
+            *self._worker_cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_STREAM_LIMIT,
+            # Own process group, so close() also stops the processes cli.mjs spawns
+            start_new_session=True,
+        )
+        self._reader = asyncio.create_task(self._reader_loop(self._proc))
+        return self._proc
+
+    @staticmethod
+    def _signal_worker(proc: asyncio.subprocess.Process, sig: signal.Signals) -> None:
+        """Send ``sig`` to the worker's process group, or just the worker if that fails."""
+        if proc.returncode is not None:
+            return
+        try:
+            os.killpg(proc.pid, sig)
+        except (AttributeError, OSError):
+            # No process groups (Windows), or the group is already gone
+            try:
+                proc.send_signal(sig)
+            except ProcessLookupError:
+                pass
+
+    async def _reader_loop(self, proc: asyncio.subprocess.Process) -> None:
+        """Resolve pending requests from the worker's response lines."""
+        assert proc.stdout is not None
+        error = ConnectionError("Node.js CLI worker exited")
+        try:
+            while line := await proc.stdout.readline():
+                try:
+                    message = await _parse_json(line)
+                except json.JSONDecodeError:
+                    continue
+                # Stray output (e.g. a log line that happens to be valid JSON) isn't a reply
+                if not isinstance(message, dict) or not isinstance(message.get("id"), int):
+                    continue
+                future = self._pending.pop(message["id"], None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except Exception as e:
+            # Most likely a reply longer than _STREAM_LIMIT; the stream can't be
+            # resynchronized, so stop this worker and let the next request start another
+            error = ConnectionError(f"Lost the Node.js CLI worker's output: {e}")
+            self._signal_worker(proc, _SIGKILL)
+
+        # Reap the worker so the next request starts a new one, and fail anything
+        # still waiting on it
+        await proc.wait()
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def _rpc(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Call a method on the RPC worker.
+
+        Args:
+            method: The RPC method name (e.g., 'tokens.list')
+            params: Keyword parameters for the method
+
+        Returns:
+            Dictionary with 'success', 'data', and 'error' keys
+        """
+        self._next_id += 1
+        request_id = self._next_id
+        request = {"id": request_id, "method": method, "params": params or {}}
+
+        try:
+            proc = await self._ensure_worker()
+            assert proc.stdin is not None
+            future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
+            proc.stdin.write(fastjson.dumps(request) + b"\n")
+            await proc.stdin.drain()
+            message = await asyncio.wait_for(future, _RPC_TIMEOUT)
+        except asyncio.TimeoutError:
+            return {
+                "success": False,
+                "data": None,
+                "error": f"Node.js CLI worker did not answer {method!r}",
+                "exit_code": -1,
+            }
+        except Exception as e:
+            return {"success": False, "data": None, "error": str(e), "exit_code": -1}
+        finally:
+            self._pending.pop(request_id, None)
+
+        if "error" in message:
+            return {"success": False, "data": None, "error": message["error"], "exit_code": 1}
+        return {"success": True, "data": message.get("result"), "error": None, "exit_code": 0}
+
+    async def close(self) -> None:
+        """Stop the RPC worker if it is running.
+
+        Closing stdin lets the worker finish any request it is writing to disk and
+        leave its read loop; SIGTERM and then SIGKILL only follow if it doesn't.
+        """
+        proc, self._proc = self._proc, None
+        reader, self._reader = self._reader, None
+        if proc is None:
+            return
+        if proc.stdin is not None:
+            proc.stdin.close()
+        for sig, timeout in ((signal.SIGTERM, _CLOSE_TIMEOUT), (_SIGKILL, _TERM_TIMEOUT)):
+            try:
+                await asyncio.wait_for(asyncio.shield(proc.wait()), timeout)
+                break
+            except asyncio.TimeoutError:
+                self._signal_worker(proc, sig)
+        await proc.wait()
+
+        if reader is not None:
+            try:
+                # Finishes at EOF, unless a process the worker left behind holds stdout open
+                await asyncio.wait_for(reader, _TERM_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+
     async def execute_command(
         self, command: str, args: list[str] | None = None, stdin_data: str | None = None
     ) -> dict[str, Any]:
@@ -55,7 +244,8 @@ class CLIBridge:
             data = None
             if stdout:
                 try:
-                    data = json.loads(stdout.decode())
+                    # Parse the bytes directly; only the text fallback needs a str
+                    data = await _parse_json(stdout)
                 except json.JSONDecodeError:
                     # If not JSON, return as plain text
                     data = stdout.decode().strip()
@@ -72,14 +262,9 @@ class CLIBridge:
 
     async def list_tokens(self) -> dict[str, Any]:
         """Get list of stored tokens."""
-        result = await self.execute_command("list-tokens")
-
-        # Parse the human-readable output for now
-        # TODO: Update CLI to support JSON output
-        if result["success"] and result["data"]:
-            tokens = self.parse_tokens_output(result["data"])
-            return {"success": True, "data": tokens, "error": None}
-
+        result = await self._rpc("tokens.list")
+        if result["success"]:
+            result["data"] = self.parse_tokens_result(result["data"])
         return result
 
     async def list_providers(self) -> dict[str, Any]:
@@ -96,8 +281,8 @@ class CLIBridge:
     async def clear_tokens(self, provider: str | None = None) -> dict[str, Any]:
         """Clear tokens for a provider or all tokens."""
         if provider:
-            return await self.execute_command("tokens:remove", [provider])
-        return await self.execute_command("clear-tokens")
+            return await self._rpc("tokens.remove", {"provider": provider})
+        return await self._rpc("tokens.clear")
 
     async def test_client_credentials(
         self,
@@ -108,94 +293,64 @@ class CLIBridge:
         scopes: str | None = None,
     ) -> dict[str, Any]:
         """Test client credentials flow."""
-        args = [
-            "client_credentials",
-            "--client-id",
-            client_id,
-            "--client-secret",
-            client_secret,
-            "--token-url",
-            token_url,
-            "--save",
-            provider,
+        return await self._rpc(
+            "token.client_credentials",
+            {
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "token_url": token_url,
+                "scope": scopes,
+                "save": provider,
+            },
+        )
+
+    def parse_tokens_result(self, data: Any) -> list[dict[str, Any]]:
+        """Normalize the worker's `tokens.list` result to the token dicts the screens use."""
+        if not isinstance(data, list):
+            return []
+        return [
+            {
+                "provider": entry.get("provider"),
+                "access_token": entry.get("access_token"),
+                "token_type": entry.get("token_type") or "Bearer",
+                "expires_at": entry.get("expires_at"),
+                "issued_at": entry.get("issued_at"),
+                "scope": entry.get("scope"),
+            }
+            for entry in data
+            if isinstance(entry, dict)
         ]
-        if scopes:
-            args.extend(["--scope", scopes])
-
-        return await self.execute_command("token", args)
-
-    def parse_tokens_output(self, output: str) -> list[dict[str, Any]]:
-        """Parse tokens from human-readable CLI output."""
-        tokens: list[dict[str, Any]] = []
-
-        # Handle "No stored tokens found" case
-        if "No stored tokens found" in output:
-            return tokens
-
-        # Parse stored tokens (simplified parsing)
-        lines = output.split("\n")
-        for line in lines:
-            if line.strip().startswith("- "):
-                # Extract provider and token preview
-                parts = line.strip()[2:].split(": ")
-                if len(parts) >= 2:
-                    provider = parts[0]
-                    token_preview = parts[1]
-
-                    tokens.append(
-                        {
-                            "provider": provider,
-                            "access_token": token_preview.replace("...", "") + "dummy_token_data",
-                            "token_type": "Bearer",
-                            "expires_at": None,  # Not available in current output
-                            "scope": None,  # Not available in current output
-                        }
-                    )
-
-        return tokens
 
     def parse_providers_output(self, output: str) -> list[dict[str, Any]]:
         """Parse providers from human-readable CLI output."""
         providers = []
+        current_provider: dict[str, Any] | None = None
 
-        lines = output.split("\n")
-        current_provider = None
-
-        for line in lines:
+        for line in output.splitlines():
             line = line.strip()
+            if not line or line.startswith(_PROVIDER_HEADERS):
+                continue
 
-            # Skip empty lines and headers
-            if not line or "Configured providers:" in line or "Available presets:" in line:
+            # Detail lines belong to the heading above them
+            detail = _PROVIDER_DETAIL_RE.fullmatch(line)
+            if detail:
+                key, value = detail.groups()
+                field = _PROVIDER_FIELDS.get(key.lower().replace(" ", "_"))
+                if current_provider is not None and field and value:
+                    current_provider[field] = value
                 continue
 
-            # Check if this is a provider name line (has parentheses)
-            if "(" in line and ")" in line:
-                # Extract provider name and ID
-                parts = line.split("(")
-                if len(parts) >= 2:
-                    name = parts[0].strip()
-                    provider_id = parts[1].replace(")", "").strip()
-
-                    current_provider = {
-                        "name": provider_id,
-                        "display_name": name,
-                        "type": "generic",
-                        "client_id": None,
-                        "token_url": None,
-                        "auth_url": None,
-                    }
-                    providers.append(current_provider)
-
-            # Parse provider details
-            elif current_provider and ": " in line:
-                key, value = line.split(": ", 1)
-                key = key.strip().lower().replace(" ", "_")
-
-                if key == "client_id":
-                    current_provider["client_id"] = value
-                elif key == "token_url":
-                    current_provider["token_url"] = value
-                elif key == "authorization_url":
-                    current_provider["auth_url"] = value
+            heading = _PROVIDER_HEADING_RE.fullmatch(line)
+            if heading:
+                name, provider_id = heading.groups()
+                current_provider = {
+                    "name": provider_id.strip(),
+                    "display_name": name,
+                    "type": "generic",
+                    "client_id": None,
+                    "token_url": None,
+                    "auth_url": None,
+                }
+                providers.append(current_provider)
 
         return providers
@@ -1,9 +1,14 @@
 """OAuth client service for high-level operations."""
 
+import asyncio
+import time
 from typing import Any
 
 from .cli_bridge import CLIBridge
 
+# Seconds a fetched token list is reused before the CLI is asked again
+_TOKENS_TTL = 3.0
+
 
 class OAuthClient:
     """High-level interface to OAuth operations."""
@@ -11,6 +16,14 @@ class OAuthClient:
     def __init__(self) -> None:
         """Initialize OAuth client with CLI bridge."""
         self.bridge = CLIBridge()
+        # (monotonic fetch time, tokens); dropped whenever the stored tokens change
+        self._tokens_cache: tuple[float, list[dict[str, Any]]] | None = None
+        # Concurrent refreshes wait for one CLI call instead of each making their own
+        self._tokens_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """Release the CLI bridge's worker process."""
+        await self.bridge.close()
 
     async def get_tokens(self) -> list[dict[str, Any]]:
         """
@@ -19,10 +32,16 @@ class OAuthClient:
         Returns:
             List of token dictionaries
         """
-        result = await self.bridge.list_tokens()
-        if result["success"] and isinstance(result["data"], list):
-            return result["data"]
-        return []
+        async with self._tokens_lock:
+            cached = self._tokens_cache
+            if cached is not None and time.monotonic() - cached[0] < _TOKENS_TTL:
+                return cached[1]
+
+            result = await self.bridge.list_tokens()
+            if result["success"] and isinstance(result["data"], list):
+                self._tokens_cache = (time.monotonic(), result["data"])
+                return result["data"]
+            return []
 
     async def get_providers(self) -> list[dict[str, Any]]:
         """
@@ -47,6 +66,7 @@ class OAuthClient:
             True if successful
         """
         result = await self.bridge.clear_tokens(provider)
+        self._tokens_cache = None
         return bool(result["success"])
 
     async def delete_all_tokens(self) -> bool:
@@ -57,6 +77,7 @@ class OAuthClient:
             True if successful
         """
         result = await self.bridge.clear_tokens()
+        self._tokens_cache = None
         return bool(result["success"])
 
     async def authenticate_client_credentials(
@@ -80,6 +101,8 @@ class OAuthClient:
         Returns:
             Result dictionary with token data
         """
-        return await self.bridge.test_client_credentials(
+        result = await self.bridge.test_client_credentials(
             provider, client_id, client_secret, token_url, scopes
         )
+        self._tokens_cache = None
+        return result
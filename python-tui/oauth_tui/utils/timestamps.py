@@ -0,0 +1,50 @@
+"""Token timestamp parsing shared by the screens."""
+
+import re
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+# datetime.fromisoformat parses a trailing "Z" (UTC) from Python 3.11 on
+_ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+# Leading date of an ISO 8601 timestamp; strings without one are rejected up front
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@lru_cache(maxsize=1024)
+def parse_timestamp(raw: float | str) -> datetime | None:
+    """Parse a Unix timestamp or ISO 8601 string, or None if it isn't valid.
+
+    Results, failures included, are cached since tokens are re-rendered often.
+    """
+    try:
+        if isinstance(raw, (int, float)):
+            return datetime.fromtimestamp(raw)
+        if not _ISO_DATE_RE.match(raw):
+            return None
+        if not _ISO_ACCEPTS_Z and raw.endswith("Z"):
+            raw = raw[:-1] + "+00:00"
+        return datetime.fromisoformat(raw)
+    except (ValueError, OSError, OverflowError):
+        # Out-of-range numbers and malformed dates after a valid-looking prefix
+        return None
+
+
+def to_datetime(raw: Any) -> datetime | None:
+    """Convert a token timestamp to a datetime.
+
+    Returns None both when the timestamp is missing and when it can't be parsed;
+    callers tell the two apart by checking ``raw``.
+    """
+    if not raw or not isinstance(raw, (int, float, str)):
+        # Other JSON values (lists, objects) are never timestamps
+        return None
+    return parse_timestamp(raw)
+
+
+def current_times() -> tuple[datetime, datetime]:
+    """Snapshot the current time as (naive local, aware UTC) for one render pass."""
+    return datetime.now(), datetime.now(timezone.utc)
@@ -0,0 +1,25 @@
+"""Input validators shared by the form screens."""
+
+from textual.validation import Length, ValidationResult, Validator
+
+# Schemes accepted for endpoint URLs
+URL_SCHEMES = ("http://", "https://")
+
+
+class URLValidator(Validator):
+    """Validator for URL fields."""
+
+    def validate(self, value: str) -> ValidationResult:
+        """Validate that the value is a proper URL."""
+        if not value:
+            return self.failure("URL cannot be empty")
+
+        if not value.startswith(URL_SCHEMES):
+            return self.failure("URL must start with http:// or https://")
+
+        return self.success()
+
+
+# Validators are stateless, so every form field shares the same instances
+REQUIRED = Length(minimum=1)
+URL = URLValidator()
@@ -0,0 +1,76 @@
+"""Incremental row updates for DataTable-backed lists."""
+
+from textual.widgets import DataTable
+from textual.widgets.data_table import ColumnKey, RowKey
+
+Row = tuple[str, ...]
+
+
+class TableRows:
+    """The rows of a DataTable as last rendered, updated cell by cell.
+
+    While there are no rows the table shows a placeholder row instead.
+    """
+
+    def __init__(self, table: DataTable, column_keys: list[ColumnKey], placeholder: Row) -> None:
+        self._table = table
+        self._column_keys = column_keys
+        self._placeholder = placeholder
+        self._placeholder_key: RowKey | None = None
+        self._row_keys: list[RowKey] = []
+        self._rendered: list[Row] = []
+
+    def __len__(self) -> int:
+        return len(self._rendered)
+
+    def sync(self, rows: list[Row]) -> None:
+        """Show ``rows``, changing only the cells that differ from the rendered ones."""
+        rendered = self._rendered
+        removed = len(rendered) - len(rows)
+        if removed > 0:
+            # Drop the rows where the lists first differ rather than shifting every
+            # later row up a cell at a time; a single deletion touches nothing else
+            start = 0
+            while start < len(rows) and rendered[start] == rows[start]:
+                start += 1
+            for index in range(start + removed - 1, start - 1, -1):
+                self.remove(index)
+
+        for index, cells in enumerate(rows[: len(rendered)]):
+            self.update(index, cells)
+        new_rows = rows[len(rendered) :]
+        if new_rows:
+            # Batch the initial load (and any other growth) into one add_rows call
+            self._row_keys.extend(self._table.add_rows(new_rows))
+            rendered.extend(new_rows)
+        self.sync_placeholder()
+
+    def update(self, index: int, cells: Row) -> None:
+        """Replace the row at ``index``."""
+        old = self._rendered[index]
+        if old == cells:
+            return
+        row_key = self._row_keys[index]
+        for column_key, old_cell, new_cell in zip(self._column_keys, old, cells, strict=True):
+            if old_cell != new_cell:
+                self._table.update_cell(row_key, column_key, new_cell)
+        self._rendered[index] = cells
+
+    def append(self, cells: Row) -> None:
+        """Add a row at the end."""
+        self._row_keys.append(self._table.add_row(*cells))
+        self._rendered.append(cells)
+
+    def remove(self, index: int) -> None:
+        """Remove the row at ``index``."""
+        self._table.remove_row(self._row_keys.pop(index))
+        del self._rendered[index]
+
+    def sync_placeholder(self) -> None:
+        """Show the placeholder row only while there are no other rows."""
+        if self._rendered:
+            if self._placeholder_key is not None:
+                self._table.remove_row(self._placeholder_key)
+                self._placeholder_key = None
+        elif self._placeholder_key is None:
+            self._placeholder_key = self._table.add_row(*self._placeholder)
@@ -4,6 +4,7 @@ Emergency terminal reset script.
 Run this if your terminal gets stuck with mouse control sequences.
 """
 
+import os
 import sys
 
 
@@ -18,16 +19,13 @@ def reset_terminal():
             "\033[?1006l",  # Disable SGR mouse mode
             "\033[?1015l",  # Disable urxvt mouse mode
             "\033[?25h",  # Show cursor
-            "\033[c",  # Reset terminal
+            "\033c",  # Reset terminal
             "\033[0m",  # Reset colors and attributes
             "\033[2J",  # Clear screen
             "\033[H",  # Move cursor to home position
         ]
 
-        for _seq in sequences:
-            pass
-
-        sys.stdout.flush()
+        os.write(sys.stdout.fileno(), "".join(sequences).encode())
 
     except Exception:
         sys.exit(1)
@@ -28,10 +28,14 @@ else
     pip install -e ".[test]" --quiet
 fi
 
+# Spread tests across CPU cores, keeping the snapshot tests (xdist_group
+# "snapshots") together on one worker
+XDIST_ARGS=(-n auto --dist=loadgroup)
+
 # Run different test categories
 echo ""
 echo "🏃 Running Unit Tests..."
-pytest tests/test_*.py -m "unit" -v
+pytest tests/test_*.py -m "unit" -v "${XDIST_ARGS[@]}"
 
 echo ""
 echo "🔄 Running Integration Tests..."  
@@ -43,7 +47,7 @@ pytest tests/test_snapshots.py -m "snapshot" -v --snapshot-update
 
 echo ""
 echo "📊 Running All Tests with Coverage..."
-pytest tests/ --cov=oauth_tui --cov-report=term-missing --cov-report=html
+pytest tests/ -m "" "${XDIST_ARGS[@]}" --cov=oauth_tui --cov-report=term-missing --cov-report=html
 
 echo ""
 echo "✅ Test run completed!"
@@ -1,11 +1,13 @@
 """Test configuration and fixtures for OAuth TUI tests."""
 
+from collections.abc import Iterator
 from typing import Any, Dict
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest  # type: ignore
 
+import oauth_tui.services.oauth_client as oauth_client_module
 from oauth_tui.app import OAuthTUI
 from oauth_tui.services.oauth_client import OAuthClient
 
@@ -14,12 +16,41 @@ from oauth_tui.services.oauth_client import OAuthClient
 def mock_oauth_service():
     """Mock OAuth service for testing."""
     service = Mock(spec=OAuthClient)
-    service.get_tokens.return_value = []
-    service.get_providers.return_value = []
-    service.delete_token.return_value = True
+    service.get_tokens = AsyncMock(return_value=[])
+    service.get_providers = AsyncMock(return_value=[])
+    service.delete_token = AsyncMock(return_value=True)
     return service
 
 
+@pytest.fixture(scope="session")  # type: ignore
+def oauth_client() -> OAuthClient:
+    """One OAuth client shared by the tests that only inspect it."""
+    try:
+        return OAuthClient()
+    except FileNotFoundError as e:
+        # The bridge needs a built dist/cli.mjs
+        pytest.skip(str(e))
+
+
+@pytest.fixture(scope="module")  # type: ignore
+def cli_bridge_cls() -> Iterator[Mock]:
+    """CLIBridge patched out of OAuthClient, built once per test module."""
+    bridge_cls = MagicMock()
+    bridge_cls.return_value.list_tokens = AsyncMock()
+    bridge_cls.return_value.clear_tokens = AsyncMock()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(oauth_client_module, "CLIBridge", bridge_cls)
+        yield bridge_cls
+
+
+@pytest.fixture  # type: ignore
+def cli_bridge(cli_bridge_cls: Mock) -> Mock:
+    """The patched bridge instance, with calls from earlier tests cleared."""
+    bridge: Mock = cli_bridge_cls.return_value
+    bridge.reset_mock()
+    return bridge
+
+
 @pytest.fixture  # type: ignore
 def app() -> OAuthTUI:
     """Create a test OAuth TUI app instance."""
@@ -1,14 +1,32 @@
 """Test the main OAuth TUI application."""
 
-from typing import TYPE_CHECKING
+import base64
+import json
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import pytest  # type: ignore
 from oauth_tui.app import OAuthTUI
+from oauth_tui.screens.inspector import InspectorScreen
+from oauth_tui.screens.tokens import ConfirmationScreen, TokensScreen, _token_row
+from oauth_tui.utils.timestamps import current_times, to_datetime
+from textual.widgets import DataTable, Static, TabbedContent, TextArea
 
 if TYPE_CHECKING:
     pass  # Import types here if needed
 
 
+def _make_jwt(payload: dict[str, Any]) -> str:
+    """Build an unsigned-looking JWT with the given payload."""
+
+    def encode(part: dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(payload)}.c2ln"
+
+
 class TestOAuthTUI:
     """Test cases for the main OAuth TUI application."""
 
@@ -26,7 +44,6 @@ class TestOAuthTUI:
             # App should start with menu screen
             assert "menu" in pilot.app._installed_screens  # type: ignore
 
-    @pytest.mark.asyncio  # type: ignore
     async def test_quit_action(self, app: OAuthTUI) -> None:
         """Test that app can quit properly."""
         async with app.run_test() as pilot:  # type: ignore
@@ -48,4 +65,177 @@ class TestOAuthTUI:
     def test_cleanup_terminal_method(self, app: OAuthTUI) -> None:
         """Test cleanup terminal method doesn't crash."""
         # This should not raise an exception
-        app._cleanup_terminal()  # type: ignore
\ No newline at end of file
+        app._cleanup_terminal()  # type: ignore
+
+    async def test_dashboard_refresh_recounts_expired_tokens(
+        self, app: OAuthTUI, mock_oauth_service: Any
+    ) -> None:
+        """Test a snapshot of unchanged tokens still counts newly expired ones."""
+        mock_oauth_service.get_tokens.return_value = [
+            {"provider": "github", "expires_at": time.time() + 1800}
+        ]
+        app.oauth_client = mock_oauth_service
+
+        async with app.run_test():  # type: ignore
+            await app.push_screen("dashboard")
+            await app.workers.wait_for_complete()
+            screen = app.screen
+            assert str(screen.query_one("#stat-expired .stat-value", Static).render()) == "0"
+
+            # Two hours on, with the same tokens
+            now, now_utc = (t + timedelta(hours=2) for t in current_times())
+            snapshot = screen.take_snapshot(now, now_utc)  # type: ignore[attr-defined]
+            assert (snapshot.expired, snapshot.status) == (1, "Warning")
+
+    async def test_dashboard_refresh_reformats_recent_tokens(
+        self, app: OAuthTUI, mock_oauth_service: Any
+    ) -> None:
+        """Test a snapshot rebuilds the recent tokens rows even for unchanged tokens."""
+        mock_oauth_service.get_tokens.return_value = [
+            {"provider": "github", "expires_at": time.time() + 1800}
+        ]
+        app.oauth_client = mock_oauth_service
+
+        async with app.run_test():  # type: ignore
+            await app.push_screen("dashboard")
+            await app.workers.wait_for_complete()
+            screen = app.screen
+            recent = screen.query_one("#recent-tokens-static", Static)
+            assert [str(cell) for cell in recent.content.columns[2].cells] == [  # type: ignore
+                "Expiring"
+            ]
+
+            # Two hours on, with the same tokens
+            now, now_utc = (t + timedelta(hours=2) for t in current_times())
+            snapshot = screen.take_snapshot(now, now_utc)  # type: ignore[attr-defined]
+            assert [row[2:4] for row in snapshot.recent] == [("Expired", "Expired")]
+
+    async def test_tokens_table_tracks_add_delete_and_refresh(
+        self, app: OAuthTUI, mock_oauth_service: Any
+    ) -> None:
+        """Test the tokens table follows the token list, rewriting no cells on a delete."""
+        tokens = [{"provider": name, "scope": "read"} for name in ("alpha", "beta", "gamma")]
+        mock_oauth_service.get_tokens.return_value = tokens[:2]
+        app.oauth_client = mock_oauth_service
+
+        async with app.run_test():  # type: ignore
+            await app.push_screen("tokens")
+            await app.workers.wait_for_complete()
+            screen = app.screen
+            table = screen.query_one(DataTable)
+
+            def providers() -> list[str]:
+                return [table.get_row_at(index)[0] for index in range(table.row_count)]
+
+            assert providers() == ["alpha", "beta"]
+
+            # Add
+            mock_oauth_service.get_tokens.return_value = tokens
+            screen.load_tokens()  # type: ignore[attr-defined]
+            await app.workers.wait_for_complete()
+            assert providers() == ["alpha", "beta", "gamma"]
+
+            # Delete the first token: the other rows keep their cells
+            mock_oauth_service.get_tokens.return_value = tokens[1:]
+            with patch.object(table, "update_cell", wraps=table.update_cell) as update_cell:
+                screen.load_tokens()  # type: ignore[attr-defined]
+                await app.workers.wait_for_complete()
+                assert providers() == ["beta", "gamma"]
+
+                # Refresh with unchanged tokens
+                screen.load_tokens()  # type: ignore[attr-defined]
+                await app.workers.wait_for_complete()
+                assert providers() == ["beta", "gamma"]
+            update_cell.assert_not_called()
+
+            # Delete everything
+            mock_oauth_service.get_tokens.return_value = []
+            screen.load_tokens()  # type: ignore[attr-defined]
+            await app.workers.wait_for_complete()
+            assert providers() == ["No tokens stored"]
+
+    async def test_delete_token_after_confirmation(
+        self, app: OAuthTUI, mock_oauth_service: Any
+    ) -> None:
+        """Test deleting a token waits for the confirmation dialog."""
+        mock_oauth_service.get_tokens.return_value = [{"provider": "alpha"}]
+        app.oauth_client = mock_oauth_service
+
+        async with app.run_test() as pilot:  # type: ignore
+            await app.push_screen("tokens")
+            await app.workers.wait_for_complete()
+
+            # Declining deletes nothing
+            await pilot.press("d")
+            await pilot.pause()
+            assert isinstance(app.screen, ConfirmationScreen)
+            await pilot.press("n")
+            await pilot.pause()
+            mock_oauth_service.delete_token.assert_not_called()
+
+            await pilot.press("d")
+            await pilot.pause()
+            await pilot.press("y")
+            await app.workers.wait_for_complete()
+            mock_oauth_service.delete_token.assert_awaited_once_with("alpha")
+            assert isinstance(app.screen, TokensScreen)
+
+    @pytest.mark.unit  # type: ignore
+    def test_parse_jwt_token_rejects_non_base64url_characters(self) -> None:
+        """Test a three-part token with stray characters is rejected before decoding."""
+        token = _make_jwt({"sub": "user"})
+        assert InspectorScreen.parse_jwt_token(token)["payload"] == {"sub": "user"}
+
+        header, payload, signature = token.split(".")
+        for bad in (f"{header}.{payload}!.{signature}", f"{header} .{payload}.{signature}"):
+            with pytest.raises(ValueError, match="non-base64url"):
+                InspectorScreen.parse_jwt_token(bad)
+
+    @pytest.mark.unit  # type: ignore
+    def test_invalid_expiry_is_shown_as_is(self) -> None:
+        """Test unparseable expirations are displayed verbatim and missing ones as N/A."""
+        now, now_utc = current_times()
+        for raw in ("soon", "2024-13-01", 1e20, [1]):
+            assert to_datetime(raw) is None
+            assert _token_row({"expires_at": raw}, now, now_utc)[2:4] == ("Active", str(raw))
+        assert _token_row({}, now, now_utc)[2:4] == ("Active", "N/A")
+
+    async def test_inspector_shows_claims_that_look_like_markup(self, app: OAuthTUI) -> None:
+        """Test claims such as "[/x]" are shown as text instead of parsed as markup."""
+        async with app.run_test():  # type: ignore
+            await app.push_screen("inspector")
+            screen = app.screen
+            token = _make_jwt({"sub": "[/x]", "name": "[bold]admin"})
+            screen.query_one("#token-input", TextArea).text = token
+            screen.parse_token()  # type: ignore[attr-defined]
+            await app.workers.wait_for_complete()
+
+            payload = "".join(
+                str(widget.render()) for widget in screen.query("#payload-content Static")
+            )
+            assert '"sub": "[/x]"' in payload
+            assert '"name": "[bold]admin"' in payload
+
+    async def test_auth_tab_switch_changes_flow(self, app: OAuthTUI) -> None:
+        """Test activating a flow's tab makes it the current flow."""
+        async with app.run_test() as pilot:  # type: ignore
+            await app.push_screen("auth")
+            screen = app.screen
+            assert screen.current_flow == "client_credentials"  # type: ignore[attr-defined]
+
+            for flow in ("device_flow", "authorization_code"):
+                screen.query_one(TabbedContent).active = flow
+                await pilot.pause()
+                assert screen.current_flow == flow  # type: ignore[attr-defined]
+
+    async def test_dashboard_status_card_after_load(
+        self, app: OAuthTUI, mock_oauth_service: Any
+    ) -> None:
+        """Test the status card shows the loaded state rather than "Loading..."."""
+        app.oauth_client = mock_oauth_service
+
+        async with app.run_test():  # type: ignore
+            await app.push_screen("dashboard")
+            await app.workers.wait_for_complete()
+            status = app.screen.query_one("#stat-status .stat-value", Static)
+            assert str(status.render()) == "Setup"
@@ -15,6 +15,7 @@ class TestOAuthTUIIntegration:
     @pytest.mark.integration  # type: ignore
     async def test_complete_token_workflow(self, app: "OAuthTUI", mock_oauth_service: Any) -> None:
         """Test complete token management workflow."""
+        app.oauth_client = mock_oauth_service
         async with app.run_test() as pilot:  # type: ignore
             # Start at menu
             assert "menu" in pilot.app._installed_screens  # type: ignore
@@ -23,7 +24,7 @@ class TestOAuthTUIIntegration:
             await pilot.press("t")  # Assuming 't' goes to tokens  # type: ignore
 
             # Wait for tokens to load
-            await pilot.pause()  # type: ignore
+            await pilot.app.workers.wait_for_complete()  # type: ignore
 
             # Test token list interaction
             await pilot.press("down")  # Navigate token list  # type: ignore
@@ -39,7 +40,7 @@ class TestOAuthTUIIntegration:
             async with app.run_test() as pilot:  # type: ignore
                 # Navigate to a screen that would trigger the service
                 await pilot.press("t")  # type: ignore
-                await pilot.pause()  # type: ignore
+                await pilot.app.workers.wait_for_complete()  # type: ignore
                 
                 # Verify error is handled gracefully
                 # (Add specific error handling assertions)
@@ -58,12 +59,11 @@ class TestOAuthTUIIntegration:
                 "up",       # Navigate up
             ]
             
-            for key in navigation_keys:
-                await pilot.press(key)  # type: ignore
-                await pilot.pause(0.1)  # Small pause between keys  # type: ignore
-                
-                # Verify app doesn't crash
-                assert pilot.app.is_running  # type: ignore
+            # press() waits for each key to be processed before sending the next
+            await pilot.press(*navigation_keys)  # type: ignore
+
+            # Verify app doesn't crash
+            assert pilot.app.is_running  # type: ignore
 
     @pytest.mark.integration  # type: ignore
     async def test_screen_transitions(self, app: "OAuthTUI") -> None:
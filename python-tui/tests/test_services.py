@@ -1,37 +1,42 @@
 """Unit tests for OAuth service components."""
 
+import asyncio
+import inspect
+import os
+import sys
+import textwrap
+from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock, patch
 
 import pytest  # type: ignore
+from oauth_tui.services import cli_bridge as cli_bridge_module
+from oauth_tui.services.cli_bridge import CLIBridge
+from oauth_tui.services.oauth_client import OAuthClient
+
+# Bridge reply for test_get_tokens; read-only, so it is built once
+_TOKENS_RESPONSE = {
+    "success": True,
+    "data": [
+        {"access_token": "token1", "expires_in": 3600},
+        {"access_token": "token2", "expires_in": 7200}
+    ]
+}
 
 
 class TestOAuthService:
     """Unit tests for OAuth service functionality."""
 
     @pytest.mark.unit  # type: ignore
-    def test_oauth_service_creation(self) -> None:
+    def test_oauth_service_creation(self, oauth_client: OAuthClient) -> None:
         """Test OAuth service can be created."""
-        from oauth_tui.services.oauth_client import OAuthClient
-        service = OAuthClient()
-        assert service is not None
+        assert oauth_client is not None
 
     @pytest.mark.unit  # type: ignore
-    @pytest.mark.asyncio  # type: ignore
-    @patch('oauth_tui.services.oauth_client.CLIBridge')
-    async def test_get_tokens(self, mock_cli_bridge: Any) -> None:
+    async def test_get_tokens(self, cli_bridge: Any) -> None:
         """Test getting tokens via CLI bridge."""
-        from oauth_tui.services.oauth_client import OAuthClient
-        
         # Mock CLI bridge response
-        mock_bridge_instance = mock_cli_bridge.return_value  # type: ignore
-        mock_bridge_instance.list_tokens = AsyncMock(return_value={
-            "success": True,
-            "data": [
-                {"access_token": "token1", "expires_in": 3600},
-                {"access_token": "token2", "expires_in": 7200}
-            ]
-        })
+        cli_bridge.list_tokens.return_value = _TOKENS_RESPONSE
         
         service = OAuthClient()
         tokens = await service.get_tokens()
@@ -41,13 +46,218 @@ class TestOAuthService:
         assert tokens[1]["access_token"] == "token2"
         
     @pytest.mark.unit  # type: ignore
-    @pytest.mark.asyncio  # type: ignore
-    async def test_delete_token(self) -> None:
-        """Test deleting a token."""
-        from oauth_tui.services.oauth_client import OAuthClient
-        
+    async def test_get_tokens_is_cached_until_tokens_change(self, cli_bridge: Any) -> None:
+        """Test repeated token reads share one CLI call until a delete."""
+        cli_bridge.list_tokens.return_value = {"success": True, "data": [{"provider": "github"}]}
+        cli_bridge.clear_tokens.return_value = {"success": True}
+
         service = OAuthClient()
-        assert hasattr(service, 'delete_token')
+        first, second = await asyncio.gather(service.get_tokens(), service.get_tokens())
+        assert first == second == [{"provider": "github"}]
+        assert cli_bridge.list_tokens.await_count == 1
+
+        await service.delete_token("github")
+        await service.get_tokens()
+        assert cli_bridge.list_tokens.await_count == 2
+
+    @pytest.mark.unit  # type: ignore
+    def test_delete_token(self) -> None:
+        """Test deleting a token."""
+        assert inspect.iscoroutinefunction(inspect.getattr_static(OAuthClient, 'delete_token'))
+
+    @pytest.mark.unit  # type: ignore
+    def test_parse_cli_text_output(self) -> None:
+        """Test the text-output parser picks out provider details."""
+        bridge = CLIBridge()
+        providers = bridge.parse_providers_output(
+            "Configured providers:\n\n"
+            "GitHub (github)\n"
+            "  Client ID: abc\n"
+            "  Token URL: https://github.com/login/oauth/access_token\n"
+            "  Scope: repo\n\n"
+            "Available presets: github, google\n"
+        )
+        assert providers == [
+            {
+                "name": "github",
+                "display_name": "GitHub",
+                "type": "generic",
+                "client_id": "abc",
+                "token_url": "https://github.com/login/oauth/access_token",
+                "auth_url": None,
+            }
+        ]
+
+    @pytest.mark.unit  # type: ignore
+    def test_parse_providers_output_line_kinds(self) -> None:
+        """Test headers, indented details and names with parentheses."""
+        providers = CLIBridge().parse_providers_output(
+            "  Configured providers:\n"
+            "Acme (EU) (acme-eu)\n"
+            "      Client ID: id-1\n"
+            "\tAuthorization URL: https://acme.example/authorize\n"
+            "  Scope: read (all)\n"
+            "  Client ID:\n"
+            "Other (other)\n"
+            "  token_url: https://other.example/token\n"
+            "  Available presets: github (default)\n"
+        )
+        assert [
+            (p["name"], p["display_name"], p["client_id"], p["token_url"], p["auth_url"])
+            for p in providers
+        ] == [
+            ("acme-eu", "Acme (EU)", "id-1", None, "https://acme.example/authorize"),
+            ("other", "Other", None, "https://other.example/token", None),
+        ]
+
+    @pytest.mark.unit  # type: ignore
+    def test_parse_providers_output_ignores_details_before_heading(self) -> None:
+        """Test detail lines with no provider heading above them are dropped."""
+        assert CLIBridge().parse_providers_output("Client ID: orphan\n") == []
+
+
+# Stand-in for `cli.mjs --rpc`: speaks the same NDJSON protocol, with a few
+# methods that misbehave on purpose. On stdin EOF it records a clean exit in the
+# file named by its first argument.
+_RPC_WORKER = textwrap.dedent(
+    """
+    import json, signal, sys, time
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        method, params = request["method"], request["params"]
+        if method == "exit":
+            sys.exit(3)
+        if method == "silent":
+            continue
+        if method == "linger":
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            time.sleep(60)
+        if method == "stray":
+            print("worker starting up")
+            print(json.dumps({"level": "info"}))
+            print(json.dumps([1]), flush=True)
+        if method == "tokens.list":
+            result = [{"provider": "github", "access_token": "abc", "expires_at": 1.5}, "junk"]
+        elif method == "big":
+            result = "x" * params["size"]
+        else:
+            result = {"method": method, "params": params}
+        print(json.dumps({"id": request["id"], "result": result}), flush=True)
+
+    with open(sys.argv[1], "w") as f:
+        f.write("clean")
+    """
+)
+
+
+class TestCLIBridgeRPC:
+    """CLIBridge's RPC channel, driven against a real worker subprocess."""
+
+    @pytest.fixture  # type: ignore
+    async def bridge(self, tmp_path: Path) -> AsyncIterator[CLIBridge]:
+        script = tmp_path / "worker.py"
+        script.write_text(_RPC_WORKER)
+        bridge = CLIBridge()
+        bridge._worker_cmd = [sys.executable, str(script), str(tmp_path / "exited")]
+        yield bridge
+        await bridge.close()
+
+    @pytest.mark.unit  # type: ignore
+    async def test_replies_are_matched_to_requests(self, bridge: CLIBridge) -> None:
+        """Test concurrent requests each get their own reply, past stray output."""
+        first, stray, second = await asyncio.gather(
+            bridge._rpc("echo", {"n": 1}), bridge._rpc("stray"), bridge._rpc("echo", {"n": 2})
+        )
+        assert first["data"] == {"method": "echo", "params": {"n": 1}}
+        assert stray["success"] is True
+        assert second["data"] == {"method": "echo", "params": {"n": 2}}
+
+    @pytest.mark.unit  # type: ignore
+    async def test_token_commands_use_rpc_methods(self, bridge: CLIBridge) -> None:
+        """Test token removal and listing go through the worker's methods."""
+        removed = await bridge.clear_tokens("github")
+        assert removed["data"] == {"method": "tokens.remove", "params": {"provider": "github"}}
+        cleared = await bridge.clear_tokens()
+        assert cleared["data"] == {"method": "tokens.clear", "params": {}}
+
+        tokens = (await bridge.list_tokens())["data"]
+        assert tokens == [
+            {
+                "provider": "github",
+                "access_token": "abc",
+                "token_type": "Bearer",
+                "expires_at": 1.5,
+                "issued_at": None,
+                "scope": None,
+            }
+        ]
+
+    @pytest.mark.unit  # type: ignore
+    async def test_reply_longer_than_default_stream_limit(self, bridge: CLIBridge) -> None:
+        """Test a reply line past asyncio's 64 KiB default is read whole."""
+        result = await bridge._rpc("big", {"size": 70_000})
+        assert result["success"] is True
+        assert len(result["data"]) == 70_000
+
+    @pytest.mark.unit  # type: ignore
+    async def test_unreadable_reply_restarts_worker(
+        self, bridge: CLIBridge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a reply over the stream limit fails fast and the next request recovers."""
+        monkeypatch.setattr(cli_bridge_module, "_STREAM_LIMIT", 1024)
+        result = await asyncio.wait_for(bridge._rpc("big", {"size": 4096}), 5)
+        assert result["success"] is False
+        assert "output" in result["error"]
+
+        result = await asyncio.wait_for(bridge._rpc("echo"), 5)
+        assert result["success"] is True
+
+    @pytest.mark.unit  # type: ignore
+    async def test_worker_exit_fails_request_and_restarts(self, bridge: CLIBridge) -> None:
+        """Test a worker dying mid-request fails that request, not later ones."""
+        result = await asyncio.wait_for(bridge._rpc("exit"), 5)
+        assert result == {
+            "success": False,
+            "data": None,
+            "error": "Node.js CLI worker exited",
+            "exit_code": -1,
+        }
+        assert (await bridge._rpc("echo"))["success"] is True
+
+    @pytest.mark.unit  # type: ignore
+    async def test_unanswered_request_times_out(
+        self, bridge: CLIBridge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a request the worker never answers returns an error after the timeout."""
+        monkeypatch.setattr(cli_bridge_module, "_RPC_TIMEOUT", 0.2)
+        result = await bridge._rpc("silent")
+        assert result["success"] is False
+        assert "did not answer 'silent'" in result["error"]
+        assert not bridge._pending
+
+    @pytest.mark.unit  # type: ignore
+    async def test_close_lets_worker_exit_cleanly(self, bridge: CLIBridge, tmp_path: Path) -> None:
+        """Test close() ends the worker through stdin EOF rather than a signal."""
+        await bridge._rpc("echo")
+        proc = bridge._proc
+        await bridge.close()
+        assert proc is not None and proc.returncode == 0
+        assert (tmp_path / "exited").read_text() == "clean"
+
+    @pytest.mark.unit  # type: ignore
+    @pytest.mark.skipif(not hasattr(os, "killpg"), reason="needs POSIX process groups")  # type: ignore
+    async def test_close_kills_worker_that_ignores_eof_and_sigterm(
+        self, bridge: CLIBridge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test close() escalates to SIGKILL when the worker won't exit."""
+        monkeypatch.setattr(cli_bridge_module, "_CLOSE_TIMEOUT", 0.2)
+        monkeypatch.setattr(cli_bridge_module, "_TERM_TIMEOUT", 0.2)
+        monkeypatch.setattr(cli_bridge_module, "_RPC_TIMEOUT", 0.2)
+        await bridge._rpc("linger")
+        proc = bridge._proc
+        await asyncio.wait_for(bridge.close(), 5)
+        assert proc is not None and proc.returncode == -9
 
 
 class TestOAuthUtils:
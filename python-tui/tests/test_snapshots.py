@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 import pytest  # type: ignore
+from oauth_tui.app import OAuthTUI
 
 # These tests require pytest-textual-snapshot plugin
 # Run: pip install pytest-textual-snapshot
@@ -10,50 +11,37 @@ import pytest  # type: ignore
 if TYPE_CHECKING:
     pass  # Import types here if needed
 
+# Under --dist=loadgroup every snapshot test runs on the same worker
+pytestmark = pytest.mark.xdist_group("snapshots")
 
-@pytest.mark.snapshot  # type: ignore
-def test_menu_screen_snapshot(snap_compare: Any) -> None:
-    """Test the menu screen appearance."""
-    from oauth_tui.app import OAuthTUI
-    
-    app = OAuthTUI(initial_view="menu")
-    assert snap_compare(app, terminal_size=(80, 24))
-
-
-@pytest.mark.snapshot  # type: ignore  
-def test_tokens_screen_snapshot(snap_compare: Any) -> None:
-    """Test the tokens screen appearance."""
-    from oauth_tui.app import OAuthTUI
-    
-    app = OAuthTUI(initial_view="tokens")
-    assert snap_compare(app, terminal_size=(80, 24))
 
-
-@pytest.mark.snapshot  # type: ignore  
-def test_menu_screen_with_interaction(snap_compare: Any) -> None:
-    """Test menu screen after key presses."""
-    from oauth_tui.app import OAuthTUI
-    
-    app = OAuthTUI(initial_view="menu")
-    # Test with arrow key navigation
-    assert snap_compare(app, press=["down", "up"], terminal_size=(80, 24))
+@pytest.mark.snapshot  # type: ignore
+@pytest.mark.parametrize(  # type: ignore
+    "view, presses",
+    [
+        ("menu", []),
+        ("tokens", []),
+        ("menu", ["down", "up"]),  # Arrow key navigation
+    ],
+    ids=["menu", "tokens", "menu-interaction"],
+)
+def test_screen_snapshot(snap_compare: Any, view: str, presses: list[str]) -> None:
+    """Test each screen's appearance at startup, optionally after key presses."""
+    app = OAuthTUI(initial_view=view)
+    assert snap_compare(app, press=presses, terminal_size=(80, 24))
 
 
 @pytest.mark.snapshot  # type: ignore
 def test_app_help_state(snap_compare: Any) -> None:
     """Test app in help state."""
-    from oauth_tui.app import OAuthTUI
-    
     app = OAuthTUI()
     # Press '?' to show help
-    assert snap_compare(app, press=["question_mark"], terminal_size=(80, 30))
+    assert snap_compare(app, press=["?"], terminal_size=(80, 30))
 
 
 @pytest.mark.snapshot  # type: ignore
 def test_custom_setup_before_snapshot(snap_compare: Any) -> None:
     """Test with custom setup before screenshot."""
-    from oauth_tui.app import OAuthTUI
-    
     app = OAuthTUI()
 
     async def setup_app(pilot: Any) -> None:
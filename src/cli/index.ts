@@ -306,4 +306,15 @@ program
     await tuiCommand(options);
   });
 
-program.parse(process.argv);
+// RPC mode - long-lived worker for the Python TUI
+if (process.argv.includes('--rpc')) {
+  import('./rpc.js')
+    .then(({ runRpcServer }) => runRpcServer())
+    .catch((error) => {
+      const errorMessage = error instanceof Error ? error.message : 'Unknown error';
+      logger.error(chalk.red('✗ RPC worker failed:'), errorMessage);
+      process.exit(1);
+    });
+} else {
+  program.parse(process.argv);
+}
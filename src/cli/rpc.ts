@@ -0,0 +1,144 @@
+import readline from 'readline';
+import winston from 'winston';
+import tokenManager from '../core/TokenManager.js';
+import { ClientCredentialsGrant } from '../grants/ClientCredentials.js';
+import { logger } from '../utils/Logger.js';
+
+interface RpcRequest {
+  id: number;
+  method: string;
+  params?: Record<string, unknown>;
+}
+
+type RpcHandler = (params: Record<string, unknown>) => Promise<unknown>;
+
+/**
+ * Return a required string parameter, rejecting missing or non-string values
+ * so they never reach storage or a token endpoint as "undefined"
+ */
+function requireString(params: Record<string, unknown>, name: string): string {
+  const value = params[name];
+  if (typeof value !== 'string' || value === '') {
+    throw new Error(`Missing or invalid parameter: ${name}`);
+  }
+  return value;
+}
+
+/**
+ * Return an optional string parameter, or undefined if it is absent or null
+ */
+function optionalString(params: Record<string, unknown>, name: string): string | undefined {
+  const value = params[name];
+  if (value === undefined || value === null || value === '') {
+    return undefined;
+  }
+  if (typeof value !== 'string') {
+    throw new Error(`Invalid parameter: ${name}`);
+  }
+  return value;
+}
+
+/**
+ * Methods exposed to the Python TUI over the RPC channel
+ */
+const handlers: Record<string, RpcHandler> = {
+  'tokens.list': async () => {
+    const tokens = [];
+    for (const provider of await tokenManager.listProviders()) {
+      const token = await tokenManager.getToken(provider);
+      if (token) {
+        tokens.push({
+          provider,
+          access_token: token.access_token,
+          token_type: token.token_type,
+          expires_at: token.expiresAt !== undefined ? token.expiresAt / 1000 : null,
+          issued_at: token.createdAt / 1000,
+          scope: token.scope ?? null,
+        });
+      }
+    }
+    return tokens;
+  },
+
+  'tokens.remove': async (params) => {
+    await tokenManager.deleteToken(requireString(params, 'provider'));
+    return null;
+  },
+
+  'tokens.clear': async () => {
+    await tokenManager.clearAll();
+    return null;
+  },
+
+  'token.client_credentials': async (params) => {
+    const client = new ClientCredentialsGrant({
+      clientId: requireString(params, 'client_id'),
+      clientSecret: requireString(params, 'client_secret'),
+      tokenUrl: requireString(params, 'token_url'),
+      authorizationUrl: '', // Not used
+      scope: optionalString(params, 'scope'),
+    });
+    const save = optionalString(params, 'save');
+    const token = await client.getAccessToken();
+    if (save) {
+      await tokenManager.storeToken(save, token);
+    }
+    return token;
+  },
+};
+
+/**
+ * Serve newline-delimited JSON requests on stdin until it closes.
+ *
+ * Each request is `{"id", "method", "params"}` and gets exactly one
+ * `{"id", "result"}` or `{"id", "error"}` line back on stdout.
+ */
+export async function runRpcServer(): Promise<void> {
+  // stdout carries the protocol, so keep console logging off it
+  for (const transport of logger.transports) {
+    if (transport instanceof winston.transports.Console) {
+      transport.silent = true;
+    }
+  }
+
+  const reply = (message: Record<string, unknown>): void => {
+    process.stdout.write(JSON.stringify(message) + '\n');
+  };
+
+  const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+  for await (const line of rl) {
+    if (!line.trim()) {
+      continue;
+    }
+
+    let request: RpcRequest;
+    try {
+      request = JSON.parse(line) as RpcRequest;
+    } catch {
+      reply({ id: null, error: 'Invalid JSON request' });
+      continue;
+    }
+    if (typeof request !== 'object' || request === null || typeof request.id !== 'number') {
+      reply({ id: null, error: 'Invalid request: missing numeric id' });
+      continue;
+    }
+    const { params } = request;
+    const validParams =
+      typeof params === 'object' && params !== null && !Array.isArray(params) ? params : {};
+
+    // Own properties only, so "constructor" or "__proto__" can't reach Object.prototype
+    const handler = Object.hasOwn(handlers, request.method) ? handlers[request.method] : undefined;
+    if (!handler) {
+      reply({ id: request.id, error: `Unknown method: ${request.method}` });
+      continue;
+    }
+
+    try {
+      reply({ id: request.id, result: await handler(validParams) });
+    } catch (error) {
+      const errorMessage = error instanceof Error ? error.message : 'Unknown error';
+      reply({ id: request.id, error: errorMessage });
+    }
+  }
+}